@@ -6,18 +6,57 @@ Dedicated to maritime community service and charitable excellence
 """
 
 import os
+import re
 import json
+import csv
+import html
+import io
+import base64
+import gzip
+import hashlib
 import sqlite3
-from datetime import datetime, date
-from flask import Flask, request, jsonify, session, send_file, abort
+import zlib
+from datetime import datetime, date, timedelta, timezone
+from decimal import Decimal
+from flask import Flask, request, jsonify, session, send_file, abort, g
 from flask_cors import CORS
 import logging
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import generate_password_hash, check_password_hash, safe_join
 from werkzeug.utils import secure_filename
+from werkzeug.datastructures import Headers
+from werkzeug.http import parse_accept_header
 import secrets
+import atexit
 import mimetypes
+import shutil
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import closing, contextmanager
+from functools import wraps
 from pathlib import Path
 
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional; without it gallery images are served as uploaded
+    Image = None
+
+try:
+    import brotli
+except ImportError:  # Optional; gzip is always available
+    brotli = None
+
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib encoder is used instead
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Optional; only used for on-the-fly response compression
+    zstandard = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,6 +74,64 @@ class Config:
     BLOG_FOLDER = '.'  # Same folder as server.py for .sh files
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'mp4', 'mov'}
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 8))  # Max open connections per process
+    DB_POOL_TIMEOUT = 10  # Seconds to wait for a free connection
+    DB_POOL_MAX_AGE = 300  # Recycle connections older than this many seconds
+    DB_JOURNAL_MODE = 'WAL'  # Readers no longer block on writers
+    DB_SYNCHRONOUS = 'NORMAL'  # Safe with WAL, avoids an fsync per commit
+    DB_CACHE_SIZE = -16000  # Negative values are KiB (16MB page cache per connection)
+    DB_MMAP_SIZE = 64 * 1024 * 1024
+    DB_BUSY_TIMEOUT = 5000  # Milliseconds to wait on a locked database
+    DB_TEMP_STORE = 'MEMORY'
+    API_DEFAULT_PAGE_SIZE = 50
+    API_MAX_PAGE_SIZE = 500
+    BLOG_INDEX_REFRESH_INTERVAL = 2  # Seconds between blog folder rescans
+    MEDIA_MAX_AGE = 3600  # Cache lifetime for gallery files that may be replaced
+    MEDIA_IMMUTABLE_MAX_AGE = 365 * 24 * 3600  # Timestamped uploads never change
+    USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE') == '1'  # Let nginx/Apache send media files
+    GALLERY_DERIVATIVE_WIDTHS = (320, 640, 1280)  # Responsive image sizes generated on upload
+    GALLERY_DERIVATIVE_QUALITY = 82
+    JOB_WORKERS = 2  # Background job threads per process
+    JOB_MAX_ATTEMPTS = 5
+    JOB_RETRY_BASE_DELAY = 2  # Seconds; doubles on every failed attempt
+    JOB_RETRY_MAX_DELAY = 300
+    JOB_LEASE_SECONDS = 600  # A running job not finished by then is retried
+    JOB_POLL_INTERVAL = 1.0
+    CHUNKED_UPLOAD_MAX_SIZE = 2 * 1024 * 1024 * 1024  # 2GB per resumable upload
+    CHUNKED_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # Suggested chunk size, below MAX_CONTENT_LENGTH
+    CHUNKED_UPLOAD_EXPIRY = 24 * 3600  # Abandoned sessions are removed after this many seconds
+    BLOB_GC_GRACE_SECONDS = 3600  # Unreferenced gallery blobs younger than this are kept
+    ASSET_MAX_AGE = 365 * 24 * 3600  # Fingerprinted CSS/JS never change under the same URL
+    JSON_SERIALIZER = os.environ.get('JSON_SERIALIZER', 'auto')  # 'auto', 'orjson' or 'json'
+    BULK_IMPORT_MAX_SIZE = 256 * 1024 * 1024  # Request body limit for bulk import streams
+    BULK_IMPORT_BATCH_SIZE = 500  # Rows per executemany/transaction
+    BULK_IMPORT_MAX_ERRORS = 100  # Row errors listed in the response; all are counted
+    WRITE_BEHIND_MODE = os.environ.get('WRITE_BEHIND_MODE', 'group')  # 'sync', 'group' or 'buffered'
+    WRITE_BEHIND_FLUSH_INTERVAL = 0.05  # Seconds between group commits
+    WRITE_BEHIND_MAX_BATCH = 500  # Flush early once this many rows are waiting
+    WRITE_BEHIND_GROUP_TIMEOUT = 5  # Seconds a 'group' request waits for its commit
+    SSE_HEARTBEAT_INTERVAL = 15  # Seconds between keep-alive comments on idle streams
+    SSE_QUEUE_SIZE = 100  # Undelivered events per client before it is disconnected
+    SSE_REPLAY_SIZE = 200  # Recent events kept for clients resuming with Last-Event-ID
+    SKILL_MATCH_DEFAULT_LIMIT = 20
+    SKILL_MATCH_MAX_LIMIT = 200
+    BIRTHDAY_DEFAULT_WINDOW = 7  # Days ahead covered by /api/members/birthdays
+    BIRTHDAY_MAX_WINDOW = 366
+    BIRTHDAY_DIGEST_WINDOW = 31  # Windows up to this are sliced from the daily digest
+    EVENT_OCCURRENCE_HORIZON = 365  # Days of recurring-event occurrences kept materialized
+    EVENT_RANGE_DEFAULT_DAYS = 30  # /api/events?from= without to
+    SEARCH_DEFAULT_LIMIT = 10  # Hits per result type
+    SEARCH_MAX_LIMIT = 50
+    EXPORT_BATCH_SIZE = 1000  # Rows fetched per round trip while streaming an export
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'memory')  # 'memory', 'sqlite' (shared) or 'none'
+    CACHE_TTL = 30  # Seconds; tag invalidation usually evicts entries long before this
+    CACHE_MAX_ENTRIES = 512
+    CACHE_SHARED_PATH = 'response_cache.db'  # Used by the 'sqlite' backend, shared by all workers
+    COMPRESSION_MIN_SIZE = 1024  # Smaller bodies are sent as-is
+    COMPRESSION_LEVEL = 6  # gzip 1-9; also used as brotli quality and zstd level
+    COMPRESSION_BUFFER_LIMIT = 1024 * 1024  # Larger or unsized bodies are compressed as a stream
+    COMPRESSION_CONTENT_TYPES = {'application/json', 'application/x-ndjson', 'text/plain', 'text/csv',
+                                 'text/html', 'text/css', 'application/javascript'}
 
 app.config.from_object(Config)
 
@@ -1286,8 +1383,8 @@ HTML_CONTENT = '''<!DOCTYPE html>
                 </div>
                 
                 <div style="text-align: center; margin-top: 3rem;">
-                    <button class="cta-button" onclick="loadEvents()">
-                        <i class="fas fa-calendar"></i> View All Missions
+                    <button class="cta-button" id="moreEventsBtn" onclick="loadEvents(true)">
+                        <i class="fas fa-calendar"></i> View More Missions
                     </button>
                 </div>
             </div>
@@ -1631,6 +1728,7 @@ HTML_CONTENT = '''<!DOCTYPE html>
 
         function closeManagementModal() {
             document.getElementById('managementModal').style.display = 'none';
+            stopDashboardStream();
         }
 
         function openGenericModal() {
@@ -1737,8 +1835,19 @@ HTML_CONTENT = '''<!DOCTYPE html>
             }
         });
 
-        document.getElementById('newsletterForm').addEventListener('submit', (e) => {
+        document.getElementById('newsletterForm').addEventListener('submit', async (e) => {
             e.preventDefault();
+            const email = e.target.querySelector('input[type="email"]').value;
+            
+            try {
+                await fetch('/api/newsletter', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ email })
+                });
+            } catch (error) {
+                console.log('API not available for newsletter signup');
+            }
             alert('Thank you for subscribing to our newsletter!');
             e.target.reset();
         });
@@ -1878,28 +1987,75 @@ HTML_CONTENT = '''<!DOCTYPE html>
                                     <div style="font-size: 0.9rem; color: #654321;">Voyages</div>
                                 </div>
                             </div>
+                            <ul id="dashboardActivity" style="list-style: none; margin-top: 1rem; font-size: 0.85rem; color: #654321; text-align: left;"></ul>
                         </div>
                     </div>
                 </div>
             `;
             
             loadDashboardStats();
+            startDashboardStream();
+        }
+
+        // Live dashboard updates pushed over Server-Sent Events
+        let dashboardStream = null;
+
+        const streamHandlers = {
+            member: d => { bumpCounter('dashVolunteerCount', 1); return `New crew member: ${d.name} (${d.role})`; },
+            members_imported: d => { bumpCounter('dashVolunteerCount', d.count); return `${d.count} crew members imported`; },
+            event: d => { bumpCounter('dashEventCount', 1); return `New voyage: ${d.title} on ${d.event_date}`; },
+            events_imported: d => { bumpCounter('dashEventCount', d.count); return `${d.count} voyages imported`; },
+            contact: d => `Message from ${d.name}: ${d.subject}`,
+            gallery: d => `Media uploaded: ${d.title}`
+        };
+
+        function bumpCounter(id, amount) {
+            const el = document.getElementById(id);
+            if (el) el.textContent = (parseInt(el.textContent, 10) || 0) + amount;
+        }
+
+        function startDashboardStream() {
+            if (dashboardStream || !window.EventSource) return;
+            dashboardStream = new EventSource('/api/stream');
+            Object.entries(streamHandlers).forEach(([kind, handler]) => {
+                dashboardStream.addEventListener(kind, (e) => {
+                    const text = handler(JSON.parse(e.data));
+                    const list = document.getElementById('dashboardActivity');
+                    if (!list) return;
+                    const item = document.createElement('li');
+                    item.textContent = text;
+                    list.prepend(item);
+                    while (list.children.length > 5) list.lastChild.remove();
+                });
+            });
+        }
+
+        function stopDashboardStream() {
+            if (dashboardStream) {
+                dashboardStream.close();
+                dashboardStream = null;
+            }
         }
 
         // Data Loading Functions
+        function gallerySrcset(item) {
+            const widths = [...new Set((item.variants || []).map(v => v.width))].sort((a, b) => a - b);
+            return widths.map(w => `/gallery/${item.filename}?w=${w} ${w}w`).join(', ');
+        }
+
         async function loadGallery() {
             try {
-                const response = await fetch('/api/gallery');
+                const response = await fetch('/api/gallery?limit=6&fields=title,description,filename,created_at,variants');
                 const data = await response.json();
                 
                 const galleryGrid = document.getElementById('galleryGrid');
                 
                 if (data.success && data.items.length > 0) {
-                    galleryGrid.innerHTML = data.items.slice(0, 6).map(item => `
+                    galleryGrid.innerHTML = data.items.map(item => `
                         <div class="gallery-item card-3d">
                             ${item.type === 'video' ? 
                                 `<video controls><source src="/gallery/${item.filename}" type="video/mp4"></video>` :
-                                `<img src="/gallery/${item.filename}" alt="${item.title}" loading="lazy">`
+                                `<img src="/gallery/${item.filename}?w=640" srcset="${gallerySrcset(item)}" sizes="(max-width: 768px) 100vw, 33vw" alt="${item.title}" loading="lazy">`
                             }
                             <div class="gallery-item-info">
                                 <h3 class="rugged-title">${item.title}</h3>
@@ -1929,24 +2085,36 @@ HTML_CONTENT = '''<!DOCTYPE html>
             }
         }
 
-        async function loadEvents() {
+        let eventsCursor = null;
+
+        async function loadEvents(append = false) {
             try {
-                const response = await fetch('/api/events');
+                const params = new URLSearchParams({
+                    limit: 12,
+                    from: new Date().toISOString().slice(0, 10),
+                    to: new Date(Date.now() + 180 * 86400000).toISOString().slice(0, 10),
+                    fields: 'title,description,occurrence_date,location'
+                });
+                if (append && eventsCursor) params.set('after', eventsCursor);
+                const response = await fetch(`/api/events?${params}`);
                 const data = await response.json();
                 
                 const eventsGrid = document.getElementById('eventsGrid');
+                eventsCursor = data.next_cursor || null;
+                document.getElementById('moreEventsBtn').style.display = eventsCursor ? '' : 'none';
                 
                 if (data.success && data.events.length > 0) {
-                    eventsGrid.innerHTML = data.events.map(event => `
+                    const cards = data.events.map(event => `
                         <div class="service-card card-3d">
                             <div class="service-icon"><i class="fas fa-calendar-check"></i></div>
                             <h3 class="rugged-title">${event.title}</h3>
-                            <p><strong>Date:</strong> ${new Date(event.event_date).toLocaleDateString()}</p>
+                            <p><strong>Date:</strong> ${new Date(event.occurrence_date).toLocaleDateString()}</p>
                             <p><strong>Location:</strong> ${event.location || 'TBD'}</p>
                             <p>${event.description || 'Join us for this important community event.'}</p>
                         </div>
                     `).join('');
-                } else {
+                    eventsGrid.innerHTML = append ? eventsGrid.innerHTML + cards : cards;
+                } else if (!append) {
                     eventsGrid.innerHTML = `
                         <div style="grid-column: 1 / -1; text-align: center; padding: 3rem; color: #654321;">
                             <i class="fas fa-calendar" style="font-size: 4rem; margin-bottom: 1rem; opacity: 0.5;"></i>
@@ -2123,6 +2291,7 @@ ${data.post.content}
 
         function logout() {
             currentUser = null;
+            stopDashboardStream();
             closeManagementModal();
             document.getElementById('loginForm').reset();
         }
@@ -2158,10 +2327,722 @@ ${data.post.content}
 </html>'''
 
 # Database initialization and all other backend code remains the same as previous version
+def configure_connection(conn):
+    """Apply per-connection performance pragmas from Config"""
+    conn.execute(f"PRAGMA busy_timeout = {int(app.config['DB_BUSY_TIMEOUT'])}")
+    conn.execute(f"PRAGMA synchronous = {app.config['DB_SYNCHRONOUS']}")
+    conn.execute(f"PRAGMA cache_size = {int(app.config['DB_CACHE_SIZE'])}")
+    conn.execute(f"PRAGMA mmap_size = {int(app.config['DB_MMAP_SIZE'])}")
+    conn.execute(f"PRAGMA temp_store = {app.config['DB_TEMP_STORE']}")
+
+# Tables whose change version is tracked in table_versions (for ETags)
+VERSIONED_TABLES = ('members', 'events', 'contact_messages', 'gallery_items')
+
+# External-content FTS5 indexes over base tables, kept in sync by triggers
+FTS_INDEXES = {
+    'members': ('name', 'skills'),
+    'events': ('title', 'description'),
+    'contact_messages': ('name', 'email', 'subject', 'message'),
+}
+FTS_TOKENIZER = 'porter unicode61 remove_diacritics 2'
+
+def fts_index_steps(table, columns):
+    """SQL that creates and backfills the FTS5 index of one table"""
+    fts = f'{table}_fts'
+    column_list = ', '.join(columns)
+    new_values = ', '.join(f'NEW.{c}' for c in columns)
+    old_values = ', '.join(f'OLD.{c}' for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({column_list}, "
+        f"content='{table}', content_rowid='id', tokenize='{FTS_TOKENIZER}')",
+        f'''CREATE TRIGGER IF NOT EXISTS trg_fts_{table}_insert AFTER INSERT ON {table}
+            BEGIN INSERT INTO {fts} (rowid, {column_list}) VALUES (NEW.id, {new_values}); END''',
+        f'''CREATE TRIGGER IF NOT EXISTS trg_fts_{table}_delete AFTER DELETE ON {table}
+            BEGIN INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', OLD.id, {old_values}); END''',
+        f'''CREATE TRIGGER IF NOT EXISTS trg_fts_{table}_update AFTER UPDATE OF {column_list} ON {table}
+            BEGIN
+                INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', OLD.id, {old_values});
+                INSERT INTO {fts} (rowid, {column_list}) VALUES (NEW.id, {new_values});
+            END''',
+        f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')",
+    ]
+
+# Normalized skill tags. members.skills and events.required_skills stay the
+# free-text source of truth; member_skills/event_skills mirror them as integer
+# ids so matching is an index seek plus a count, not a string scan.
+SKILL_TAG_TABLES = {
+    'members': ('member_skills', 'member_id', 'skills'),
+    'events': ('event_skills', 'event_id', 'required_skills'),
+}
+
+def skill_key(name):
+    """Normalized tag name: Unicode case folding (SQLite NOCASE only folds ASCII)"""
+    return ' '.join(name.split()).casefold()
+
+def parse_skills(text):
+    """Split free-text skills into distinct tag names, keeping first-seen spelling"""
+    if isinstance(text, (list, tuple)):
+        text = ','.join(str(item) for item in text)
+    names = {}
+    for part in re.split(r'[,;/\n]', text or ''):
+        name = ' '.join(part.split())
+        if name and skill_key(name) not in names:
+            names[skill_key(name)] = name
+    return list(names.values())
+
+def skill_ids(conn, names):
+    """Return {skill_key: id}, creating tags that do not exist yet"""
+    keyed = {}
+    for name in names:
+        keyed.setdefault(skill_key(name), name)
+    keys = list(keyed)
+    ids = {}
+    for start in range(0, len(keys), 500):
+        chunk = keys[start:start + 500]
+        conn.executemany('INSERT OR IGNORE INTO skills (name, name_key) VALUES (?, ?)',
+                         [(keyed[key], key) for key in chunk])
+        rows = conn.execute(f"SELECT id, name_key FROM skills WHERE name_key IN ({', '.join('?' for _ in chunk)})",
+                            chunk)
+        ids.update((key, skill_id) for skill_id, key in rows)
+    return ids
+
+def merge_skill_keys(cursor):
+    """Backfill skills.name_key, folding tags that differ only beyond ASCII case into one"""
+    kept = {}
+    for skill_id, name in cursor.execute('SELECT id, name FROM skills ORDER BY id').fetchall():
+        key = skill_key(name)
+        if key not in kept:
+            kept[key] = skill_id
+            cursor.execute('UPDATE skills SET name_key = ? WHERE id = ?', (key, skill_id))
+            continue
+        for table, column in (('member_skills', 'member_id'), ('event_skills', 'event_id')):
+            cursor.execute(f'INSERT OR IGNORE INTO {table} ({column}, skill_id) '
+                           f'SELECT {column}, ? FROM {table} WHERE skill_id = ?', (kept[key], skill_id))
+            cursor.execute(f'DELETE FROM {table} WHERE skill_id = ?', (skill_id,))
+        cursor.execute('DELETE FROM skills WHERE id = ?', (skill_id,))
+
+def sync_skill_tags(conn, resource, rows):
+    """Rewrite the tag rows of (id, skills_text) pairs; the caller commits"""
+    table, key, _ = SKILL_TAG_TABLES[resource]
+    parsed = [(row_id, parse_skills(text)) for row_id, text in rows]
+    ids = skill_ids(conn, [name for _, names in parsed for name in names])
+    conn.executemany(f'DELETE FROM {table} WHERE {key} = ?', [(row_id,) for row_id, _ in parsed])
+    conn.executemany(f'INSERT OR IGNORE INTO {table} ({key}, skill_id) VALUES (?, ?)',
+                     [(row_id, ids[skill_key(name)]) for row_id, names in parsed for name in names])
+
+def update_skill_tags(resource, after_id=None, row_ids=None):
+    """Sync tags for the given rows, or for every row with id > after_id"""
+    table, _, column = SKILL_TAG_TABLES[resource]
+    try:
+        with get_db_connection() as conn:
+            if row_ids is not None:
+                placeholders = ', '.join('?' for _ in row_ids)
+                rows = conn.execute(f'SELECT id, {column} FROM {resource} WHERE id IN ({placeholders})',
+                                    list(row_ids)).fetchall()
+            else:
+                rows = conn.execute(f'SELECT id, {column} FROM {resource} WHERE id > ?',
+                                    (after_id or 0,)).fetchall()
+            sync_skill_tags(conn, resource, [tuple(row) for row in rows])
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.error(f"Skill tag sync for {resource} failed: {e}")
+
+# Versioned schema migrations, tracked with PRAGMA user_version.
+# Each entry is (version, description, steps); a step is either an SQL string
+# or a callable taking the cursor. Append new entries, never edit shipped ones.
+SCHEMA_MIGRATIONS = [
+    (1, 'Secondary indexes for hot route queries', [
+        'CREATE INDEX IF NOT EXISTS idx_members_active_role_name ON members(role DESC, name) WHERE active = 1',
+        'CREATE INDEX IF NOT EXISTS idx_events_event_date ON events(event_date)',
+        'CREATE INDEX IF NOT EXISTS idx_contact_messages_created_at ON contact_messages(created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_gallery_items_created_at ON gallery_items(created_at)',
+    ]),
+    (2, 'Trigger-maintained stats_counters for /api/stats', [
+        '''CREATE TABLE IF NOT EXISTS stats_counters (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            members INTEGER NOT NULL DEFAULT 0,
+            events INTEGER NOT NULL DEFAULT 0,
+            messages INTEGER NOT NULL DEFAULT 0,
+            gallery_items INTEGER NOT NULL DEFAULT 0
+        )''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_stats_members_insert AFTER INSERT ON members
+            WHEN NEW.active = 1
+            BEGIN UPDATE stats_counters SET members = members + 1 WHERE id = 1; END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_stats_members_delete AFTER DELETE ON members
+            WHEN OLD.active = 1
+            BEGIN UPDATE stats_counters SET members = members - 1 WHERE id = 1; END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_stats_members_active AFTER UPDATE OF active ON members
+            WHEN (OLD.active = 1) IS NOT (NEW.active = 1)
+            BEGIN UPDATE stats_counters SET members = members + (NEW.active = 1) - (OLD.active = 1) WHERE id = 1; END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_stats_events_insert AFTER INSERT ON events
+            BEGIN UPDATE stats_counters SET events = events + 1 WHERE id = 1; END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_stats_events_delete AFTER DELETE ON events
+            BEGIN UPDATE stats_counters SET events = events - 1 WHERE id = 1; END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_stats_messages_insert AFTER INSERT ON contact_messages
+            BEGIN UPDATE stats_counters SET messages = messages + 1 WHERE id = 1; END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_stats_messages_delete AFTER DELETE ON contact_messages
+            BEGIN UPDATE stats_counters SET messages = messages - 1 WHERE id = 1; END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_stats_gallery_insert AFTER INSERT ON gallery_items
+            BEGIN UPDATE stats_counters SET gallery_items = gallery_items + 1 WHERE id = 1; END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_stats_gallery_delete AFTER DELETE ON gallery_items
+            BEGIN UPDATE stats_counters SET gallery_items = gallery_items - 1 WHERE id = 1; END''',
+        lambda cursor: cursor.execute(RECONCILE_STATS_SQL),
+    ]),
+    (3, 'Image dimensions and responsive variants on gallery_items', [
+        'ALTER TABLE gallery_items ADD COLUMN width INTEGER',
+        'ALTER TABLE gallery_items ADD COLUMN height INTEGER',
+        'ALTER TABLE gallery_items ADD COLUMN variants TEXT',  # JSON list of derivative files
+        'CREATE INDEX IF NOT EXISTS idx_gallery_items_filename ON gallery_items(filename)',
+    ]),
+    (4, 'Background job queue', [
+        '''CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            progress INTEGER NOT NULL DEFAULT 0,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 5,
+            run_after REAL NOT NULL DEFAULT 0,
+            lease_until REAL,
+            error TEXT,
+            result TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )''',
+        'CREATE INDEX IF NOT EXISTS idx_jobs_status_run_after ON jobs(status, run_after)',
+    ]),
+    (5, 'Resumable upload sessions', [
+        '''CREATE TABLE IF NOT EXISTS upload_sessions (
+            id TEXT PRIMARY KEY,
+            filename TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            sha256 TEXT,
+            metadata TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )''',
+        'CREATE INDEX IF NOT EXISTS idx_upload_sessions_updated_at ON upload_sessions(updated_at)',
+    ]),
+    (6, 'Content-addressed gallery storage', [
+        'ALTER TABLE gallery_items ADD COLUMN content_hash TEXT',
+        'CREATE INDEX IF NOT EXISTS idx_gallery_items_content_hash ON gallery_items(content_hash)',
+    ]),
+    (7, 'Per-table change versions for conditional GETs', [
+        '''CREATE TABLE IF NOT EXISTS table_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID''',
+        # A random epoch keeps ETags from a previous copy of the database from matching
+        "INSERT OR IGNORE INTO table_versions (name, version) VALUES ('epoch', abs(random() % 1000000000))",
+        *[f"INSERT OR IGNORE INTO table_versions (name) VALUES ('{table}')" for table in VERSIONED_TABLES],
+        *[f'''CREATE TRIGGER IF NOT EXISTS trg_versions_{table}_{event.lower()} AFTER {event} ON {table}
+            BEGIN UPDATE table_versions SET version = version + 1 WHERE name = '{table}'; END'''
+          for table in VERSIONED_TABLES for event in ('INSERT', 'UPDATE', 'DELETE')],
+    ]),
+    (8, 'Full-text search indexes', [
+        *[step for table, columns in FTS_INDEXES.items() for step in fts_index_steps(table, columns)],
+        # Blog posts are files, so their index is filled by sync_blog_search_index()
+        f'''CREATE VIRTUAL TABLE IF NOT EXISTS blog_posts_fts USING fts5(
+            filename UNINDEXED, mtime_ns UNINDEXED, size UNINDEXED, title, body,
+            tokenize='{FTS_TOKENIZER}'
+        )''',
+    ]),
+    (9, 'Normalized skill tags for volunteer matching', [
+        'ALTER TABLE events ADD COLUMN required_skills TEXT',
+        '''CREATE TABLE IF NOT EXISTS skills (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE COLLATE NOCASE
+        )''',
+        '''CREATE TABLE IF NOT EXISTS member_skills (
+            skill_id INTEGER NOT NULL REFERENCES skills(id),
+            member_id INTEGER NOT NULL REFERENCES members(id) ON DELETE CASCADE,
+            PRIMARY KEY (skill_id, member_id)
+        ) WITHOUT ROWID''',
+        'CREATE INDEX IF NOT EXISTS idx_member_skills_member ON member_skills(member_id)',
+        '''CREATE TABLE IF NOT EXISTS event_skills (
+            event_id INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+            skill_id INTEGER NOT NULL REFERENCES skills(id),
+            PRIMARY KEY (event_id, skill_id)
+        ) WITHOUT ROWID''',
+        lambda cursor: sync_skill_tags(cursor, 'members', cursor.execute(
+            "SELECT id, skills FROM members WHERE skills IS NOT NULL AND skills != ''").fetchall()),
+        # Lets the in-memory SkillIndex notice tag changes
+        "INSERT OR IGNORE INTO table_versions (name) VALUES ('member_skills')",
+        *[f'''CREATE TRIGGER IF NOT EXISTS trg_versions_member_skills_{event.lower()} AFTER {event} ON member_skills
+            BEGIN UPDATE table_versions SET version = version + 1 WHERE name = 'member_skills'; END'''
+          for event in ('INSERT', 'DELETE')],
+    ]),
+    (10, 'Day-of-year index for upcoming birthdays', [
+        # Day of year on the 2000 (leap) calendar, so Feb 29 is always 60 and
+        # every other date keeps the same number in leap and common years
+        '''ALTER TABLE members ADD COLUMN birthday_doy INTEGER GENERATED ALWAYS AS (
+            CASE WHEN birthday GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+                 THEN CAST(strftime('%j', '2000' || substr(birthday, 5, 6)) AS INTEGER) END
+        ) VIRTUAL''',
+        'CREATE INDEX IF NOT EXISTS idx_members_birthday_doy ON members(birthday_doy) WHERE active = 1',
+    ]),
+    (11, 'Event registrations and waitlists', [
+        '''CREATE TABLE IF NOT EXISTS event_registrations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+            email TEXT NOT NULL,
+            name TEXT,
+            status TEXT NOT NULL CHECK (status IN ('confirmed', 'waitlisted', 'cancelled')),
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )''',
+        # One live registration per person and event; cancelled ones are history
+        """CREATE UNIQUE INDEX IF NOT EXISTS idx_event_registrations_live
+            ON event_registrations(event_id, email) WHERE status != 'cancelled'""",
+        'CREATE INDEX IF NOT EXISTS idx_event_registrations_status ON event_registrations(event_id, status, id)',
+    ]),
+    (12, 'Recurring events and materialized occurrences', [
+        'ALTER TABLE events ADD COLUMN rrule TEXT',
+        'ALTER TABLE events ADD COLUMN occurrences_through TEXT',  # Last date expanded for rrule events
+        '''CREATE TABLE IF NOT EXISTS event_occurrences (
+            event_id INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+            occurrence_date TEXT NOT NULL,
+            occurrence_time TEXT,
+            PRIMARY KEY (event_id, occurrence_date)
+        ) WITHOUT ROWID''',
+        'CREATE INDEX IF NOT EXISTS idx_event_occurrences_date ON event_occurrences(occurrence_date, event_id)',
+        # One-off events have exactly one occurrence, maintained here; rrule
+        # events are expanded by materialize_occurrences()
+        '''CREATE TRIGGER IF NOT EXISTS trg_occurrences_events_insert AFTER INSERT ON events
+            WHEN NEW.rrule IS NULL
+            BEGIN
+                INSERT OR IGNORE INTO event_occurrences (event_id, occurrence_date, occurrence_time)
+                VALUES (NEW.id, NEW.event_date, NEW.event_time);
+            END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_occurrences_events_update
+            AFTER UPDATE OF event_date, event_time, rrule ON events
+            BEGIN
+                DELETE FROM event_occurrences WHERE event_id = NEW.id;
+                INSERT INTO event_occurrences (event_id, occurrence_date, occurrence_time)
+                SELECT NEW.id, NEW.event_date, NEW.event_time WHERE NEW.rrule IS NULL;
+                UPDATE events SET occurrences_through = NULL WHERE id = NEW.id;
+            END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_occurrences_events_delete AFTER DELETE ON events
+            BEGIN DELETE FROM event_occurrences WHERE event_id = OLD.id; END''',
+        '''INSERT OR IGNORE INTO event_occurrences (event_id, occurrence_date, occurrence_time)
+            SELECT id, event_date, event_time FROM events''',
+    ]),
+    (13, 'Cancellation tokens for event registrations', [
+        # SHA-256 of the token handed out at signup; older rows can only be cancelled by a leader
+        'ALTER TABLE event_registrations ADD COLUMN cancel_token_hash TEXT',
+    ]),
+    (14, 'Unicode case-folded skill tag keys', [
+        'ALTER TABLE skills ADD COLUMN name_key TEXT',
+        merge_skill_keys,
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_skills_name_key ON skills(name_key)',
+    ]),
+]
+
+# Recompute every counter from scratch (migration seed and --reconcile-stats)
+RECONCILE_STATS_SQL = '''
+    INSERT OR REPLACE INTO stats_counters (id, members, events, messages, gallery_items)
+    SELECT 1,
+        (SELECT COUNT(*) FROM members WHERE active = 1),
+        (SELECT COUNT(*) FROM events),
+        (SELECT COUNT(*) FROM contact_messages),
+        (SELECT COUNT(*) FROM gallery_items)
+'''
+
+STATS_SQL = 'SELECT members, events, messages, gallery_items FROM stats_counters WHERE id = 1'
+
+def reconcile_stats_counters():
+    """Rebuild stats_counters from COUNT(*) queries, returning (before, after) dicts"""
+    with get_db_connection() as conn:
+        conn.execute('BEGIN IMMEDIATE')
+        before = conn.execute(STATS_SQL).fetchone()
+        conn.execute(RECONCILE_STATS_SQL)
+        after = conn.execute(STATS_SQL).fetchone()
+        conn.commit()
+    return (dict(before) if before else {}), dict(after)
+
+# Paginated list resources. 'order' must end in a unique column so cursors are
+# unambiguous; 'required' columns are always selected (sort keys, derived fields).
+LIST_RESOURCES = {
+    'members': {
+        'table': 'members',
+        'where': 'active = 1',
+        'order': (('role', 'DESC'), ('name', 'ASC'), ('id', 'ASC')),
+        'fields': ('id', 'name', 'email', 'role', 'join_date', 'birthday', 'phone',
+                   'address', 'skills', 'active', 'created_at'),
+        'required': (),
+    },
+    'events': {
+        'table': 'events',
+        'where': "event_date >= date('now')",
+        'order': (('event_date', 'ASC'), ('id', 'ASC')),
+        'fields': ('id', 'title', 'description', 'event_date', 'event_time', 'location', 'category',
+                   'max_participants', 'current_participants', 'required_skills', 'rrule', 'created_by',
+                   'created_at'),
+        'required': (),
+    },
+    # Dated occurrences of one-off and recurring events, filtered by date range
+    'event_occurrences': {
+        'table': 'event_occurrences JOIN events ON events.id = event_occurrences.event_id',
+        'where': None,
+        'order': (('occurrence_date', 'ASC'), ('event_id', 'ASC')),
+        'fields': ('event_id', 'occurrence_date', 'occurrence_time', 'title', 'description', 'location',
+                   'category', 'max_participants', 'current_participants', 'required_skills', 'rrule'),
+        'required': (),
+    },
+    'gallery_items': {
+        'table': 'gallery_items',
+        'where': None,
+        'order': (('created_at', 'DESC'), ('id', 'DESC')),
+        'fields': ('id', 'title', 'description', 'filename', 'file_type', 'category',
+                   'uploaded_by', 'created_at', 'width', 'height', 'variants'),
+        'required': ('file_type',),
+    },
+}
+
+def encode_cursor(values):
+    """Encode sort-key values as an opaque URL-safe cursor"""
+    raw = json.dumps(list(values), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, resource):
+    """Decode a cursor produced by encode_cursor, raising ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError('Invalid cursor') from e
+    if not isinstance(values, list) or len(values) != len(LIST_RESOURCES[resource]['order']):
+        raise ValueError('Invalid cursor')
+    if not all(v is None or isinstance(v, (str, int, float)) for v in values):
+        raise ValueError('Invalid cursor')
+    return values
+
+def build_page_query(resource, columns, limit, after=None, filters=()):
+    """Build (sql, params) for one keyset page of a list resource.
+
+    Without a cursor this is a plain ordered LIMIT. With one, the "rows after
+    the cursor" condition is split into one branch per sort column so every
+    branch is an index seek even for mixed ASC/DESC orders like members.
+    filters are extra (condition, params) pairs ANDed onto the resource's where.
+    """
+    spec = LIST_RESOURCES[resource]
+    order = spec['order']
+    order_sql = ', '.join(f'{column} {direction}' for column, direction in order)
+    select_sql = f"SELECT {', '.join(columns)} FROM {spec['table']}"
+    base_conditions = ([spec['where']] if spec['where'] else []) + [condition for condition, _ in filters]
+    filter_params = [p for _, condition_params in filters for p in condition_params]
+
+    if after is None:
+        where_sql = f" WHERE {' AND '.join(base_conditions)}" if base_conditions else ''
+        return f'{select_sql}{where_sql} ORDER BY {order_sql} LIMIT ?', filter_params + [limit]
+
+    branches = []
+    for i, (column, direction) in enumerate(order):
+        prefix = [f'{c} IS ?' for c, _ in order[:i]]
+        prefix_params = list(after[:i])
+        value = after[i]
+        # SQLite sorts NULL first, so a DESC walk reaches NULLs last
+        if direction == 'ASC':
+            tails = [(f'{column} > ?', [value])] if value is not None else [(f'{column} IS NOT NULL', [])]
+        else:
+            tails = [(f'{column} < ?', [value]), (f'{column} IS NULL', [])] if value is not None else []
+        for condition, condition_params in tails:
+            conditions = base_conditions + prefix + [condition]
+            branches.append((
+                f"SELECT * FROM ({select_sql} WHERE {' AND '.join(conditions)} ORDER BY {order_sql} LIMIT ?)",
+                filter_params + prefix_params + condition_params + [limit]
+            ))
+
+    sql = ' UNION ALL '.join(branch for branch, _ in branches) + f' ORDER BY {order_sql} LIMIT ?'
+    params = [p for _, branch_params in branches for p in branch_params] + [limit]
+    return sql, params
+
+def build_count_query(resource, filters=()):
+    """Build (sql, params) for the COUNT(*) matching a list resource's filter"""
+    spec = LIST_RESOURCES[resource]
+    conditions = ([spec['where']] if spec['where'] else []) + [condition for condition, _ in filters]
+    where_sql = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+    params = [p for _, condition_params in filters for p in condition_params]
+    return f"SELECT COUNT(*) AS count FROM {spec['table']}{where_sql}", params
+
+def fetch_page(resource, args, decorate=None, filters=()):
+    """Run one keyset page for a list resource from request args.
+
+    Returns (items, next_cursor, total_count); total_count is None unless
+    include_total was requested. decorate(item, row) may add derived fields;
+    filters are passed through to build_page_query.
+    Raises ValueError for bad parameters.
+    """
+    spec = LIST_RESOURCES[resource]
+
+    try:
+        limit = int(args.get('limit', app.config['API_DEFAULT_PAGE_SIZE']))
+    except ValueError:
+        raise ValueError('limit must be an integer')
+    limit = max(1, min(limit, app.config['API_MAX_PAGE_SIZE']))
+
+    fields = args.get('fields')
+    if fields:
+        requested = list(dict.fromkeys(f.strip() for f in fields.split(',') if f.strip()))
+        unknown = [f for f in requested if f not in spec['fields']]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    else:
+        requested = list(spec['fields'])
+    sort_columns = [column for column, _ in spec['order']]
+    columns = list(dict.fromkeys(requested + sort_columns + list(spec['required'])))
+
+    after = args.get('after')
+    after = decode_cursor(after, resource) if after else None
+
+    # Fetch one extra row to learn whether another page exists
+    sql, params = build_page_query(resource, columns, limit + 1, after, filters)
+    rows = execute_query(sql, params, fetch=True)
+    if rows is None:
+        return None, None, None
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1][column] for column in sort_columns])
+
+    total_count = None
+    if args.get('include_total', '').lower() in ('1', 'true', 'yes'):
+        count = execute_query(*build_count_query(resource, filters), fetch=True)
+        total_count = count[0]['count'] if count else None
+
+    # Requested fields lead the SELECT list, so rows zip straight onto them
+    items = []
+    for row in rows:
+        item = dict(zip(requested, row))
+        if decorate:
+            decorate(item, row)
+        items.append(item)
+    return items, next_cursor, total_count
+
+def page_response(key, items, next_cursor, total_count):
+    """Standard JSON envelope for a paginated list"""
+    payload = {
+        'success': True,
+        key: items,
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None
+    }
+    if total_count is not None:
+        payload['total_count'] = total_count
+    return json_response(payload)
+
+# JSON serialization for list responses. Serializers turn a payload straight
+# into UTF-8 bytes; orjson is used when installed, the stdlib encoder otherwise.
+def json_default(value):
+    """Encode values neither JSON backend handles on its own"""
+    if isinstance(value, sqlite3.Row):
+        return dict(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+class StdlibJSONSerializer:
+    """Serializer backed by the json module"""
+    name = 'json'
+
+    def __init__(self):
+        self.encoder = json.JSONEncoder(default=json_default, ensure_ascii=False, separators=(',', ':'))
+
+    def dumps(self, payload):
+        return self.encoder.encode(payload).encode('utf-8')
+
+class OrjsonSerializer:
+    """Serializer backed by orjson, which encodes dates natively"""
+    name = 'orjson'
+
+    def dumps(self, payload):
+        return orjson.dumps(payload, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+JSON_SERIALIZERS = {'json': StdlibJSONSerializer}
+if orjson is not None:
+    JSON_SERIALIZERS['orjson'] = OrjsonSerializer
+
+_json_serializer = None
+
+def get_json_serializer():
+    """Return the configured serializer, falling back to the stdlib one"""
+    global _json_serializer
+    choice = app.config['JSON_SERIALIZER']
+    if choice == 'auto':
+        choice = 'orjson' if 'orjson' in JSON_SERIALIZERS else 'json'
+    if choice not in JSON_SERIALIZERS:
+        logger.warning(f"JSON serializer '{choice}' is not available, using json")
+        choice = 'json'
+    if _json_serializer is None or _json_serializer.name != choice:
+        _json_serializer = JSON_SERIALIZERS[choice]()
+    return _json_serializer
+
+def json_response(payload, status=200):
+    """Serialize a payload with the fast serializer into a JSON response"""
+    return app.response_class(get_json_serializer().dumps(payload), status=status,
+                              mimetype='application/json')
+
+def benchmark_serializers(row_count=10000, repeat=5):
+    """Compare per-row CPU of jsonify against each serializer on synthetic lists.
+
+    Rows are generated in an in-memory copy of the members and events tables,
+    so column types match production. Returns {resource: {method: us_per_row}}.
+    """
+    with get_db_connection() as conn:
+        schema = {row['name']: row['sql'] for row in conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name IN ('members', 'events')")}
+
+    bench = sqlite3.connect(':memory:')
+    bench.row_factory = sqlite3.Row
+    for sql in schema.values():
+        bench.execute(sql)
+    bench.executemany(
+        'INSERT INTO members (name, email, role, join_date, birthday, phone, address, skills) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        [(f'Member {i}', f'member{i}@example.org', 'Volunteer', '2024-01-15', '1990-06-01',
+          '555-0100', f'{i} Harbor Road', 'Navigation, First Aid') for i in range(row_count)]
+    )
+    bench.executemany(
+        'INSERT INTO events (title, description, event_date, event_time, location, category, '
+        'max_participants, current_participants, created_by) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        [(f'Event {i}', 'Community service outing along the waterfront', '2030-05-01', '09:00',
+          'Harbor Park', 'community', 50, i % 50, 'admin') for i in range(row_count)]
+    )
+
+    results = {}
+    for resource in ('members', 'events'):
+        fields = LIST_RESOURCES[resource]['fields']
+        rows = bench.execute(f"SELECT {', '.join(fields)} FROM {resource}").fetchall()
+
+        def legacy():
+            with app.app_context():
+                jsonify({'success': True, resource: [dict(row) for row in rows]}).get_data()
+
+        methods = {'jsonify': legacy}
+        for name, serializer_class in JSON_SERIALIZERS.items():
+            serializer = serializer_class()
+            methods[name] = lambda serializer=serializer: serializer.dumps(
+                {'success': True, resource: [dict(zip(fields, row)) for row in rows]})
+
+        results[resource] = {}
+        for name, method in methods.items():
+            timings = []
+            for _ in range(repeat):
+                started = time.process_time()
+                method()
+                timings.append(time.process_time() - started)
+            results[resource][name] = round(min(timings) / len(rows) * 1e6, 3)
+    bench.close()
+    return results
+
+# SQL behind each read route, with sample parameters for EXPLAIN QUERY PLAN
+CONTACT_LIST_SQL = 'SELECT * FROM contact_messages ORDER BY created_at DESC LIMIT 50'
+
+BIRTHDAY_RANGE_SQL = '''
+    SELECT id, name, role, birthday FROM members
+    WHERE active = 1 AND birthday_doy BETWEEN ? AND ?
+'''
+
+# Search types only a signed-in leader may query
+SEARCH_PRIVATE_TYPES = ('messages',)
+
+# Search over each FTS index. snippet() marks hits with \x02/\x03 so the
+# text can be HTML-escaped before the markers become <mark> tags.
+SEARCH_SQL = {
+    'messages': '''
+        SELECT m.id, m.name, m.email, m.subject, m.created_at,
+               snippet(contact_messages_fts, -1, char(2), char(3), '…', 16) AS snippet
+        FROM contact_messages_fts JOIN contact_messages m ON m.id = contact_messages_fts.rowid
+        WHERE contact_messages_fts MATCH ? ORDER BY contact_messages_fts.rank LIMIT ?
+    ''',
+    'members': '''
+        SELECT m.id, m.name, m.role, m.skills,
+               snippet(members_fts, -1, char(2), char(3), '…', 16) AS snippet
+        FROM members_fts JOIN members m ON m.id = members_fts.rowid
+        WHERE members_fts MATCH ? AND m.active = 1 ORDER BY members_fts.rank LIMIT ?
+    ''',
+    'events': '''
+        SELECT e.id, e.title, e.event_date, e.location,
+               snippet(events_fts, -1, char(2), char(3), '…', 16) AS snippet
+        FROM events_fts JOIN events e ON e.id = events_fts.rowid
+        WHERE events_fts MATCH ? ORDER BY events_fts.rank LIMIT ?
+    ''',
+    'blog': '''
+        SELECT filename, title, snippet(blog_posts_fts, -1, char(2), char(3), '…', 16) AS snippet
+        FROM blog_posts_fts WHERE blog_posts_fts MATCH ? ORDER BY rank LIMIT ?
+    ''',
+}
+
+HOT_QUERIES = {
+    'GET /api/members': build_page_query('members', ['*'], 51),
+    'GET /api/members?after=': build_page_query('members', ['*'], 51, ['Volunteer', 'Alice', 1]),
+    'GET /api/events': build_page_query('events', ['*'], 51),
+    'GET /api/events?after=': build_page_query('events', ['*'], 51, ['2025-01-01', 1]),
+    'GET /api/events?from=&to=': build_page_query(
+        'event_occurrences', ['occurrence_date', 'event_id', 'title'], 51, None,
+        [('occurrence_date BETWEEN ? AND ?', ['2025-01-01', '2025-01-31'])]),
+    'GET /api/events?from=&to=&after=': build_page_query(
+        'event_occurrences', ['occurrence_date', 'event_id', 'title'], 51, ['2025-01-10', 3],
+        [('occurrence_date BETWEEN ? AND ?', ['2025-01-01', '2025-01-31'])]),
+    'GET /api/contact': (CONTACT_LIST_SQL, ()),
+    'GET /api/gallery': build_page_query('gallery_items', ['*'], 51),
+    'GET /api/gallery?after=': build_page_query('gallery_items', ['*'], 51, ['2025-01-01 00:00:00', 1]),
+    'GET /api/stats': (STATS_SQL, ()),
+    'GET /api/members/birthdays': (BIRTHDAY_RANGE_SQL, (1, 7)),
+    **{f'GET /api/search ({kind})': (sql, ('"alice"', 10)) for kind, sql in SEARCH_SQL.items()},
+}
+
+def check_query_plans(conn):
+    """Return (route, plan detail) pairs for hot queries that full-scan or sort a base table"""
+    problems = []
+    for route, (sql, params) in HOT_QUERIES.items():
+        plan = conn.execute(f'EXPLAIN QUERY PLAN {sql}', params).fetchall()
+        for node_id, parent_id, _, detail in plan:
+            full_scan = detail.startswith('SCAN ') and not detail.startswith('SCAN (') and ' USING ' not in detail
+            # An FTS5 table constrained by MATCH (idxStr contains M) is an index lookup
+            if re.search(r' VIRTUAL TABLE INDEX \d+:\S*M', detail):
+                full_scan = False
+            # Sorting a LIMITed subquery's output is bounded; sorting a table read is not
+            sorts_subquery = any(p == parent_id and d.startswith('SCAN (') for _, p, _, d in plan)
+            if full_scan or (detail.startswith('USE TEMP B-TREE') and not sorts_subquery):
+                problems.append((route, detail))
+    return problems
+
+def run_migrations(conn):
+    """Apply pending schema migrations in order, one transaction each"""
+    current = conn.execute('PRAGMA user_version').fetchone()[0]
+    for version, description, steps in SCHEMA_MIGRATIONS:
+        if version <= current:
+            continue
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            for step in steps:
+                if callable(step):
+                    step(cursor)
+                else:
+                    cursor.execute(step)
+            cursor.execute(f'PRAGMA user_version = {int(version)}')
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            logger.error(f"Schema migration {version} ({description}) failed")
+            raise
+        logger.info(f"Applied schema migration {version}: {description}")
+        current = version
+    return current
+
 def init_database():
     """Initialize the SQLite database with required tables"""
-    conn = sqlite3.connect(app.config['DATABASE_PATH'])
+    conn = sqlite3.connect(app.config['DATABASE_PATH'], isolation_level=None)
+    journal_mode = conn.execute(f"PRAGMA journal_mode = {app.config['DB_JOURNAL_MODE']}").fetchone()[0]
+    configure_connection(conn)
     cursor = conn.cursor()
+    cursor.execute('BEGIN')
     
     # Members table
     cursor.execute('''
@@ -2262,46 +3143,1054 @@ def init_database():
                 INSERT INTO members (name, email, role, birthday, join_date)
                 VALUES (?, ?, ?, ?, ?)
             ''', (name, email, role, birthday, '2020-01-01'))
-    
-    conn.commit()
+
+    cursor.execute('COMMIT')
+    schema_version = run_migrations(conn)
     conn.close()
-    logger.info("Database initialized successfully")
+    logger.info(f"Database initialized successfully (journal_mode={journal_mode}, schema version {schema_version})")
 
 # Database helper functions
+class ConnectionPool:
+    """Bounded pool of reusable SQLite connections shared by all request threads"""
+
+    def __init__(self, database_path, size=8, timeout=10, max_age=300):
+        self.database_path = database_path
+        self.size = size
+        self.timeout = timeout
+        self.max_age = max_age
+        self.pid = os.getpid()
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self._open = 0
+        self._stats = {
+            'created': 0,
+            'reused': 0,
+            'recycled': 0,
+            'health_check_failures': 0,
+            'timeouts': 0,
+        }
+
+    def _connect(self):
+        conn = sqlite3.connect(self.database_path, timeout=self.timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        configure_connection(conn)
+        with self._lock:
+            self._stats['created'] += 1
+        return conn, time.monotonic()
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._open -= 1
+
+    def _is_healthy(self, conn):
+        try:
+            conn.execute('SELECT 1').fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def acquire(self):
+        """Check out a connection, opening a new one if the pool has room"""
+        while True:
+            try:
+                conn, created_at = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_open = self._open < self.size
+                    if can_open:
+                        self._open += 1
+                if can_open:
+                    try:
+                        return self._connect()
+                    except sqlite3.Error:
+                        with self._lock:
+                            self._open -= 1
+                        raise
+                try:
+                    conn, created_at = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    with self._lock:
+                        self._stats['timeouts'] += 1
+                    raise TimeoutError(f"No database connection available after {self.timeout}s")
+
+            if time.monotonic() - created_at > self.max_age:
+                with self._lock:
+                    self._stats['recycled'] += 1
+                self._discard(conn)
+                continue
+            if not self._is_healthy(conn):
+                with self._lock:
+                    self._stats['health_check_failures'] += 1
+                self._discard(conn)
+                continue
+
+            with self._lock:
+                self._stats['reused'] += 1
+            return conn, created_at
+
+    def release(self, conn, created_at):
+        """Return a connection to the pool, rolling back any open transaction"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put_nowait((conn, created_at))
+        except (sqlite3.Error, queue.Full):
+            self._discard(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection for the duration of a with-block"""
+        conn, created_at = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn, created_at)
+
+    def close_all(self):
+        """Close every idle connection"""
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+    def stats(self):
+        """Snapshot of pool usage counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['open'] = self._open
+        stats['idle'] = self._idle.qsize()
+        stats['in_use'] = stats['open'] - stats['idle']
+        stats['size'] = self.size
+        return stats
+
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+def get_db_pool():
+    """Get the process-wide connection pool, rebuilding it after a fork"""
+    global _db_pool
+    pool = _db_pool
+    if pool is None or pool.pid != os.getpid() or pool.database_path != app.config['DATABASE_PATH']:
+        with _db_pool_lock:
+            pool = _db_pool
+            if pool is None or pool.pid != os.getpid() or pool.database_path != app.config['DATABASE_PATH']:
+                if pool is not None and pool.pid == os.getpid():
+                    pool.close_all()
+                pool = ConnectionPool(
+                    app.config['DATABASE_PATH'],
+                    size=app.config['DB_POOL_SIZE'],
+                    timeout=app.config['DB_POOL_TIMEOUT'],
+                    max_age=app.config['DB_POOL_MAX_AGE']
+                )
+                _db_pool = pool
+    return pool
+
 def get_db_connection():
-    """Get database connection"""
-    conn = sqlite3.connect(app.config['DATABASE_PATH'])
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Borrow a pooled database connection (use as a context manager)"""
+    return get_db_pool().connection()
 
 def execute_query(query, params=None, fetch=False):
     """Execute database query with error handling"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        
-        if fetch:
-            result = cursor.fetchall()
-            conn.close()
-            return result
-        else:
-            conn.commit()
-            conn.close()
-            return cursor.lastrowid
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            
+            if fetch:
+                return cursor.fetchall()
+            else:
+                conn.commit()
+                return cursor.lastrowid
     except Exception as e:
         logger.error(f"Database error: {e}")
         return None
 
+# Background job queue
+JOB_HANDLERS = {}
+
+def job_handler(kind):
+    """Register fn(payload, report_progress) as the handler for a job kind"""
+    def register(fn):
+        JOB_HANDLERS[kind] = fn
+        return fn
+    return register
+
+class JobQueue:
+    """SQLite-backed job queue drained by a pool of worker threads.
+
+    Jobs are claimed with a lease, so work held by a crashed process is
+    picked up again once the lease expires. Failures are retried with
+    exponential backoff until max_attempts is reached.
+    """
+
+    def __init__(self):
+        self.pid = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads = []
+
+    def ensure_started(self):
+        """Start worker threads in this process if they are not running"""
+        if self.pid == os.getpid() and self._threads:
+            return  # Fast path, taken on every request
+        with self._lock:
+            if self.pid == os.getpid() and self._threads:
+                return
+            self.pid = os.getpid()
+            self._stopping.clear()
+            self._threads = []
+            for i in range(app.config['JOB_WORKERS']):
+                thread = threading.Thread(target=self._run, name=f'job-worker-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout=5):
+        """Ask worker threads to exit after their current job"""
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self):
+        self._wakeup.set()
+
+    def _claim(self):
+        now = time.time()
+        with get_db_connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            job = conn.execute('''
+                SELECT * FROM jobs
+                WHERE (status = 'queued' AND run_after <= ?)
+                   OR (status = 'running' AND lease_until < ?)
+                ORDER BY run_after, id
+                LIMIT 1
+            ''', (now, now)).fetchone()
+            if job is None:
+                conn.rollback()
+                return None
+            conn.execute('''
+                UPDATE jobs
+                SET status = 'running', attempts = attempts + 1, lease_until = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (now + app.config['JOB_LEASE_SECONDS'], job['id']))
+            conn.commit()
+        job = dict(job)
+        job['attempts'] += 1
+        return job
+
+    def _finish(self, job, status, error=None, result=None, run_after=None):
+        execute_query('''
+            UPDATE jobs
+            SET status = ?, error = ?, result = ?, run_after = COALESCE(?, run_after),
+                progress = CASE WHEN ? = 'done' THEN 100 ELSE progress END,
+                lease_until = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', (status, error, json.dumps(result) if result is not None else None,
+              run_after, status, job['id']))
+
+    def _execute(self, job):
+        handler = JOB_HANDLERS.get(job['kind'])
+        if handler is None:
+            self._finish(job, 'failed', error=f"No handler for job kind {job['kind']}")
+            return
+
+        def report_progress(percent):
+            execute_query(
+                'UPDATE jobs SET progress = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+                (max(0, min(99, int(percent))), job['id'])
+            )
+
+        try:
+            result = handler(json.loads(job['payload']), report_progress)
+        except Exception as e:
+            if job['attempts'] < job['max_attempts']:
+                delay = min(app.config['JOB_RETRY_BASE_DELAY'] * 2 ** (job['attempts'] - 1),
+                            app.config['JOB_RETRY_MAX_DELAY'])
+                logger.warning(f"Job {job['id']} ({job['kind']}) failed, retrying in {delay}s: {e}")
+                self._finish(job, 'queued', error=str(e), run_after=time.time() + delay)
+            else:
+                logger.error(f"Job {job['id']} ({job['kind']}) failed permanently: {e}")
+                self._finish(job, 'failed', error=str(e))
+            return
+        self._finish(job, 'done', result=result)
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                job = self._claim()
+            except Exception as e:
+                logger.error(f"Job queue error: {e}")
+                job = None
+            if job is None:
+                self._wakeup.wait(app.config['JOB_POLL_INTERVAL'])
+                self._wakeup.clear()
+                continue
+            self._execute(job)
+
+job_queue = JobQueue()
+
+@app.before_request
+def start_job_workers():
+    """Resume queued or interrupted jobs in every server process.
+
+    WSGI servers such as gunicorn import the app without running __main__,
+    and each forked worker needs its own threads, so the first request a
+    process handles starts them.
+    """
+    job_queue.ensure_started()
+
+def enqueue_job(kind, payload, max_attempts=None, delay=0):
+    """Persist a job and wake a worker; returns the job id"""
+    job_id = execute_query(
+        'INSERT INTO jobs (kind, payload, max_attempts, run_after) VALUES (?, ?, ?, ?)',
+        (kind, json.dumps(payload), max_attempts or app.config['JOB_MAX_ATTEMPTS'], time.time() + delay)
+    )
+    if job_id:
+        job_queue.ensure_started()
+        job_queue.notify()
+    return job_id
+
+# Write-behind buffer for small, independent inserts (contact form, newsletter).
+# WRITE_BEHIND_MODE picks the durability trade-off:
+#   sync     - insert and commit inside the request, one transaction per row
+#   group    - the request waits until the shared batch holding its row commits
+#   buffered - acknowledge at once; rows queued at a crash are lost
+WRITE_BEHIND_STATEMENTS = {
+    'contact_message': 'INSERT INTO contact_messages (name, email, subject, message) VALUES (?, ?, ?, ?)',
+    'newsletter_subscription': (
+        'INSERT INTO newsletter_subscriptions (email) VALUES (?) '
+        'ON CONFLICT(email) DO UPDATE SET active = 1'
+    ),
+}
+
+class WriteTicket:
+    """Completion signal a 'group' request waits on for its queued row"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.ok = False
+
+    def finish(self, ok):
+        self.ok = ok
+        self.done.set()
+
+class WriteBehindBuffer:
+    """Queue inserts in memory and group-commit them from a flusher thread"""
+
+    def __init__(self):
+        self.pid = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._pending = []
+        self.counters = {'submitted': 0, 'written': 0, 'rejected': 0, 'withdrawn': 0, 'batches': 0,
+                         'failed_flushes': 0}
+
+    def ensure_started(self):
+        """Start the flusher thread in this process if it is not running"""
+        with self._lock:
+            if self.pid == os.getpid() and self._thread:
+                return
+            if self.pid != os.getpid():
+                self._pending = []  # Rows queued by a parent process are not ours to write
+                self.pid = os.getpid()
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+            self._thread.start()
+
+    def submit(self, statement, values):
+        """Queue one insert; returns 'stored', 'pending' (will still be committed) or 'failed'"""
+        mode = app.config['WRITE_BEHIND_MODE']
+        if mode == 'sync':
+            return 'stored' if execute_query(WRITE_BEHIND_STATEMENTS[statement], values) is not None else 'failed'
+        
+        self.ensure_started()
+        ticket = WriteTicket() if mode == 'group' else None
+        entry = (statement, values, ticket)
+        with self._lock:
+            self._pending.append(entry)
+            self.counters['submitted'] += 1
+            full = len(self._pending) >= app.config['WRITE_BEHIND_MAX_BATCH']
+        if full:
+            self._wakeup.set()
+        if ticket is None:
+            return 'stored'
+        if not ticket.done.wait(app.config['WRITE_BEHIND_GROUP_TIMEOUT']):
+            # Withdraw the row if no flush has picked it up yet, so a client
+            # retrying after the error cannot end up with a duplicate
+            with self._lock:
+                for index, queued in enumerate(self._pending):
+                    if queued is entry:
+                        del self._pending[index]
+                        self.counters['withdrawn'] += 1
+                        return 'failed'
+            if not ticket.done.is_set():
+                return 'pending'  # Part of a flush still in progress
+        return 'stored' if ticket.ok else 'failed'
+
+    def flush(self):
+        """Write every queued row in one transaction; returns rows written"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            
+            grouped = {}
+            for statement, values, _ in batch:
+                grouped.setdefault(statement, []).append(values)
+            try:
+                with get_db_connection() as conn:
+                    try:
+                        for statement, rows in grouped.items():
+                            conn.executemany(WRITE_BEHIND_STATEMENTS[statement], rows)
+                        conn.commit()
+                        results = [True] * len(batch)
+                    except sqlite3.IntegrityError:
+                        # Redo the batch one row at a time so only the offending rows fail
+                        conn.rollback()
+                        results = []
+                        for statement, values, _ in batch:
+                            try:
+                                conn.execute(WRITE_BEHIND_STATEMENTS[statement], values)
+                                results.append(True)
+                            except sqlite3.IntegrityError as e:
+                                logger.error(f"Write-behind rejected a {statement} row: {e}")
+                                results.append(False)
+                        conn.commit()
+            except sqlite3.Error as e:
+                # Transient (e.g. database is locked): keep the rows and retry on the next tick
+                logger.error(f"Write-behind flush of {len(batch)} rows failed: {e}")
+                with self._lock:
+                    self._pending[:0] = batch
+                    self.counters['failed_flushes'] += 1
+                return 0
+            
+            written = sum(results)
+            if written:
+                response_cache.invalidate('stats')
+            for (_, _, ticket), ok in zip(batch, results):
+                if ticket is not None:
+                    ticket.finish(ok)
+            with self._lock:
+                self.counters['written'] += written
+                self.counters['rejected'] += len(batch) - written
+                self.counters['batches'] += 1
+            return written
+
+    def close(self, timeout=5):
+        """Stop the flusher and write out whatever is still queued"""
+        if self.pid != os.getpid():
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+        if self._pending:
+            logger.error(f"Write-behind buffer dropped {len(self._pending)} rows at shutdown")
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters, pending=len(self._pending), mode=app.config['WRITE_BEHIND_MODE'])
+        stats['average_batch'] = round(stats['written'] / stats['batches'], 1) if stats['batches'] else 0
+        return stats
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(app.config['WRITE_BEHIND_FLUSH_INTERVAL'])
+            self._wakeup.clear()
+            self.flush()
+
+write_behind = WriteBehindBuffer()
+atexit.register(write_behind.close)
+
+# In-process pub/sub feeding /api/stream. Insert paths publish small deltas and
+# every connected dashboard gets them over Server-Sent Events. Each idle client
+# costs a blocked queue.get(), so for thousands of connections run under a
+# cooperative worker (gunicorn -k gevent --worker-connections 5000 server:app),
+# where threading and queue are green. The bus is per process: with several
+# workers, a client sees the deltas of the worker it is connected to.
+class EventSubscription:
+    def __init__(self, size):
+        self.queue = queue.Queue(maxsize=size)
+        self.closed = False
+
+class EventBus:
+    """Fan out published events to subscriber queues, keeping a short replay log"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._recent = deque(maxlen=app.config['SSE_REPLAY_SIZE'])
+        self._next_id = 1
+        self.counters = {'published': 0, 'dropped_subscribers': 0}
+
+    def publish(self, kind, data):
+        with self._lock:
+            event = (self._next_id, kind, data)
+            self._next_id += 1
+            self._recent.append(event)
+            self.counters['published'] += 1
+            for subscription in list(self._subscribers):
+                try:
+                    subscription.queue.put_nowait(event)
+                except queue.Full:
+                    # A client this far behind reconnects and replays from its last id
+                    subscription.closed = True
+                    self._subscribers.discard(subscription)
+                    self.counters['dropped_subscribers'] += 1
+
+    def subscribe(self, last_event_id=None):
+        """Register a subscriber, queueing any missed events after last_event_id"""
+        subscription = EventSubscription(app.config['SSE_QUEUE_SIZE'])
+        with self._lock:
+            if last_event_id is not None:
+                for event in self._recent:
+                    if event[0] > last_event_id and not subscription.queue.full():
+                        subscription.queue.put_nowait(event)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, subscribers=len(self._subscribers), last_event_id=self._next_id - 1)
+
+event_bus = EventBus()
+
+# Static asset pipeline: at startup the inline CSS/JS in HTML_CONTENT is split
+# into fingerprinted files and every representation is compressed once.
+class StaticAsset:
+    """An in-memory asset with its precomputed content encodings"""
+
+    def __init__(self, body, content_type):
+        self.body = body.encode('utf-8')
+        self.content_type = content_type
+        self.fingerprint = hashlib.sha256(self.body).hexdigest()[:16]
+        self.encodings = {'identity': self.body}
+        self.encodings['gzip'] = gzip.compress(self.body, compresslevel=9, mtime=0)
+        if brotli is not None:
+            self.encodings['br'] = brotli.compress(self.body, quality=11)
+
+    def etag(self, encoding):
+        # Each encoding is a distinct representation and needs its own strong ETag
+        return self.fingerprint if encoding == 'identity' else f'{self.fingerprint}-{encoding}'
+
+def build_asset_bundle(html):
+    """Extract inline <style>/<script> blocks into fingerprinted assets.
+
+    Returns (shell, assets) where shell is the rewritten HTML page and
+    assets maps public file names to StaticAsset objects.
+    """
+    assets = {}
+
+    def extract(html, pattern, extension, content_type, tag):
+        def replace(match):
+            asset = StaticAsset(match.group(1), content_type)
+            name = f'app.{asset.fingerprint}.{extension}'
+            assets[name] = asset
+            return tag.format(url=f'/assets/{name}')
+        return re.sub(pattern, replace, html, flags=re.DOTALL)
+
+    html = extract(html, r'<style>(.*?)</style>', 'css', 'text/css; charset=utf-8',
+                   '<link rel="stylesheet" href="{url}">')
+    html = extract(html, r'<script>(.*?)</script>', 'js', 'application/javascript; charset=utf-8',
+                   '<script src="{url}"></script>')
+    return StaticAsset(html, 'text/html; charset=utf-8'), assets
+
+def serve_static_asset(asset, immutable):
+    """Send the best precomputed encoding of an asset, or 304 if the client has it"""
+    available = [e for e in ('br', 'gzip') if e in asset.encodings] + ['identity']
+    encoding = request.accept_encodings.best_match(available) or 'identity'
+    
+    if immutable:
+        cache_headers = {'Cache-Control': f"public, max-age={app.config['ASSET_MAX_AGE']}, immutable"}
+    else:
+        cache_headers = {'Cache-Control': 'no-cache'}
+    
+    if request.if_none_match and any(request.if_none_match.contains_weak(asset.etag(e)) for e in available):
+        response = app.response_class(status=304, headers=cache_headers)
+    else:
+        response = app.response_class(asset.encodings[encoding], content_type=asset.content_type,
+                                      headers=cache_headers)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+    response.set_etag(asset.etag(encoding))
+    response.vary.add('Accept-Encoding')
+    return response
+
+HTML_SHELL, STATIC_ASSETS = build_asset_bundle(HTML_CONTENT)
+
+# On-the-fly response compression for everything the app generates dynamically
+class ResponseCompressor:
+    """WSGI middleware that gzip/brotli/zstd-encodes eligible responses"""
+
+    def __init__(self, wsgi_app, config):
+        self.wsgi_app = wsgi_app
+        self.config = config
+        self.lock = threading.Lock()
+        self.counters = {'compressed': 0, 'skipped': 0, 'bytes_in': 0, 'bytes_out': 0, 'cpu_seconds': 0.0}
+        self.by_encoding = {}
+
+    def available_encodings(self):
+        encodings = []
+        if brotli is not None:
+            encodings.append('br')
+        if zstandard is not None:
+            encodings.append('zstd')
+        return encodings + ['gzip']
+
+    def compressor(self, encoding):
+        """Return (compress, flush) callables for a fresh compression stream"""
+        level = self.config['COMPRESSION_LEVEL']
+        if encoding == 'br':
+            stream = brotli.Compressor(quality=min(level, 11))
+            return stream.process, stream.finish
+        if encoding == 'zstd':
+            stream = zstandard.ZstdCompressor(level=level).compressobj()
+            return stream.compress, stream.flush
+        stream = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+        return stream.compress, stream.flush
+
+    @staticmethod
+    def with_written(app_iter, written):
+        """Interleave data given to the legacy write() callable with the app's iterable"""
+        try:
+            for chunk in app_iter:
+                while written:
+                    yield written.popleft()
+                yield chunk
+            while written:
+                yield written.popleft()
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+
+    def eligible(self, environ, status, headers):
+        if environ.get('REQUEST_METHOD') == 'HEAD':
+            return False
+        code = int(status.split(' ', 1)[0])
+        if code < 200 or code >= 300 or code in (204, 206):
+            return False
+        if 'Content-Encoding' in headers or 'Content-Range' in headers:
+            return False
+        if 'no-transform' in headers.get('Cache-Control', ''):
+            return False
+        content_type = headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if content_type not in self.config['COMPRESSION_CONTENT_TYPES']:
+            return False
+        length = headers.get('Content-Length')
+        return length is None or int(length) >= self.config['COMPRESSION_MIN_SIZE']
+
+    def record(self, encoding, bytes_in, bytes_out, cpu_seconds):
+        with self.lock:
+            self.counters['compressed'] += 1
+            self.counters['bytes_in'] += bytes_in
+            self.counters['bytes_out'] += bytes_out
+            self.counters['cpu_seconds'] += cpu_seconds
+            self.by_encoding[encoding] = self.by_encoding.get(encoding, 0) + 1
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.counters, by_encoding=dict(self.by_encoding))
+        stats['bytes_saved'] = stats['bytes_in'] - stats['bytes_out']
+        stats['cpu_seconds'] = round(stats['cpu_seconds'], 6)
+        return stats
+
+    def __call__(self, environ, start_response):
+        captured = {}
+        written = deque()  # write() data held until the headers are final
+
+        def write(data):
+            if 'write' in captured:
+                captured['write'](data)  # Passed through uncompressed, headers already sent
+            else:
+                written.append(data)
+
+        def capture(status, headers, exc_info=None):
+            captured.update(status=status, headers=Headers(headers), exc_info=exc_info)
+            return write
+
+        app_iter = self.wsgi_app(environ, capture)
+        status, headers, exc_info = captured['status'], captured['headers'], captured['exc_info']
+        content_type = headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        vary = ','.join(headers.getlist('Vary')).lower()
+        if content_type in self.config['COMPRESSION_CONTENT_TYPES'] and 'accept-encoding' not in vary:
+            headers.add('Vary', 'Accept-Encoding')
+
+        accept = parse_accept_header(environ.get('HTTP_ACCEPT_ENCODING', ''))
+        encoding = accept.best_match(self.available_encodings())
+        if encoding is None or not self.eligible(environ, status, headers):
+            with self.lock:
+                self.counters['skipped'] += 1
+            captured['write'] = start_response(status, headers.to_wsgi_list(), exc_info)
+            while written:
+                captured['write'](written.popleft())
+            return app_iter
+
+        headers['Content-Encoding'] = encoding
+        headers.remove('Content-Length')
+        if headers.get('ETag', '').startswith('"'):
+            # A different byte sequence must not share the identity representation's strong ETag
+            headers['ETag'] = 'W/' + headers['ETag']
+
+        app_iter = self.with_written(app_iter, written)
+        return self.compress_response(app_iter, encoding, status, headers, exc_info, start_response)
+
+    def compress_response(self, app_iter, encoding, status, headers, exc_info, start_response):
+        compress, flush = self.compressor(encoding)
+        limit = self.config['COMPRESSION_BUFFER_LIMIT']
+        try:
+            # Buffer up to the limit so small bodies go out with a Content-Length
+            buffered, size, iterator = [], 0, iter(app_iter)
+            for chunk in iterator:
+                buffered.append(chunk)
+                size += len(chunk)
+                if size > limit:
+                    break
+            else:
+                if hasattr(app_iter, 'close'):
+                    app_iter.close()
+                started = time.thread_time()
+                body = compress(b''.join(buffered)) + flush()
+                self.record(encoding, size, len(body), time.thread_time() - started)
+                headers['Content-Length'] = str(len(body))
+                start_response(status, headers.to_wsgi_list(), exc_info)
+                return [body]
+        except BaseException:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+            raise
+
+        start_response(status, headers.to_wsgi_list(), exc_info)
+        return self.stream(app_iter, iterator, buffered, encoding, compress, flush)
+
+    def stream(self, app_iter, iterator, buffered, encoding, compress, flush):
+        """Compress a large body chunk by chunk without holding it in memory"""
+        bytes_in = bytes_out = 0
+        cpu_seconds = 0.0
+        try:
+            for source in (buffered, iterator):
+                for chunk in source:
+                    started = time.thread_time()
+                    data = compress(chunk)
+                    cpu_seconds += time.thread_time() - started
+                    bytes_in += len(chunk)
+                    if data:
+                        bytes_out += len(data)
+                        yield data
+            started = time.thread_time()
+            data = flush()
+            cpu_seconds += time.thread_time() - started
+            bytes_out += len(data)
+            yield data
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+        self.record(encoding, bytes_in, bytes_out, cpu_seconds)
+
+response_compressor = ResponseCompressor(app.wsgi_app, app.config)
+app.wsgi_app = response_compressor
+
+# Response cache for read endpoints. Entries are keyed by path and query string
+# and tagged with the tables they were built from; writes evict by tag.
+class MemoryCacheBackend:
+    """Per-process LRU cache with expiry"""
+    name = 'memory'
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires, tags, entry)
+        self._tags = {}  # tag -> set of keys
+
+    def get(self, key):
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            if cached[0] < time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return cached[2]
+
+    def set(self, key, entry, tags, ttl):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.time() + ttl, tags, entry)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tags):
+        with self._lock:
+            keys = set().union(*(self._tags.get(tag, ()) for tag in tags))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def size(self):
+        return len(self._entries)
+
+    def _remove(self, key):
+        _, tags, _ = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+class SQLiteCacheBackend:
+    """Cache in a side SQLite file so every worker process sees the same entries.
+
+    Stands in for Redis on single-host deployments; anything implementing
+    get/set/invalidate/size can be dropped in the same way.
+    """
+    name = 'sqlite'
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    entry BLOB NOT NULL,
+                    expires REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries(expires);
+                CREATE TABLE IF NOT EXISTS cache_tags (
+                    tag TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    PRIMARY KEY (tag, key)
+                ) WITHOUT ROWID;
+            ''')
+
+    @contextmanager
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=app.config['DB_BUSY_TIMEOUT'] / 1000)
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA synchronous = OFF')  # A lost cache write is harmless
+            self._local.conn, self._local.pid = conn, os.getpid()
+        with conn:
+            yield conn
+
+    def get(self, key):
+        with self._connection() as conn:
+            row = conn.execute('SELECT entry FROM cache_entries WHERE key = ? AND expires >= ?',
+                               (key, time.time())).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key, entry, tags, ttl):
+        with self._connection() as conn:
+            conn.execute('DELETE FROM cache_tags WHERE key = ?', (key,))
+            conn.execute('INSERT OR REPLACE INTO cache_entries (key, entry, expires) VALUES (?, ?, ?)',
+                         (key, json.dumps(entry), time.time() + ttl))
+            conn.executemany('INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)',
+                             [(tag, key) for tag in tags])
+            # Trim expired entries first, then the soonest to expire
+            conn.execute('''
+                DELETE FROM cache_entries WHERE key IN (
+                    SELECT key FROM cache_entries ORDER BY expires
+                    LIMIT max(0, (SELECT COUNT(*) FROM cache_entries) - ?)
+                )
+            ''', (self.max_entries,))
+            conn.execute('DELETE FROM cache_tags WHERE key NOT IN (SELECT key FROM cache_entries)')
+
+    def invalidate(self, tags):
+        placeholders = ', '.join('?' for _ in tags)
+        with self._connection() as conn:
+            cursor = conn.execute(f'''
+                DELETE FROM cache_entries
+                WHERE key IN (SELECT key FROM cache_tags WHERE tag IN ({placeholders}))
+            ''', list(tags))
+            conn.execute(f'DELETE FROM cache_tags WHERE tag IN ({placeholders})', list(tags))
+            return cursor.rowcount
+
+    def size(self):
+        with self._connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM cache_entries').fetchone()[0]
+
+class ResponseCache:
+    """Caches full GET responses and evicts them by tag when data changes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._backend = None
+        self._backend_key = None
+        self.counters = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    def backend(self):
+        """The configured backend, or None if caching is disabled"""
+        name = app.config['CACHE_BACKEND']
+        key = (name, app.config['CACHE_SHARED_PATH'], app.config['CACHE_MAX_ENTRIES'])
+        with self._lock:
+            if self._backend_key != key:
+                if name == 'sqlite':
+                    self._backend = SQLiteCacheBackend(app.config['CACHE_SHARED_PATH'],
+                                                       app.config['CACHE_MAX_ENTRIES'])
+                elif name == 'memory':
+                    self._backend = MemoryCacheBackend(app.config['CACHE_MAX_ENTRIES'])
+                else:
+                    self._backend = None
+                self._backend_key = key
+            return self._backend
+
+    def count(self, counter, amount=1):
+        with self._lock:
+            self.counters[counter] += amount
+
+    def invalidate(self, *tags):
+        """Evict every entry carrying any of the tags"""
+        backend = self.backend()
+        if backend is None or not tags:
+            return 0
+        try:
+            evicted = backend.invalidate(tags)
+        except sqlite3.Error as e:
+            logger.error(f"Response cache invalidation failed for {tags}: {e}")
+            return 0
+        self.count('evictions', evicted)
+        return evicted
+
+    def stats(self):
+        backend = self.backend()
+        with self._lock:
+            stats = dict(self.counters)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else 0
+        stats['backend'] = backend.name if backend else None
+        stats['entries'] = backend.size() if backend else 0
+        return stats
+
+response_cache = ResponseCache()
+
+def cached_response(*tags, ttl=None):
+    """Serve GET requests for a view from the response cache.
+
+    Only successful, non-streamed responses are stored. tags name the data
+    the response depends on; ttl defaults to CACHE_TTL. Under versioned_etag
+    the table versions are part of the key, so a body is never served with
+    a newer version than the one it was built at.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            backend = response_cache.backend()
+            if request.method != 'GET' or backend is None:
+                return view(*args, **kwargs)
+            
+            key = f"{request.path}?{'&'.join(sorted(request.query_string.decode('latin-1').split('&')))}"
+            if g.get('version_etag'):
+                key += f"#{g.version_etag}"
+            try:
+                entry = backend.get(key)
+            except sqlite3.Error as e:
+                logger.error(f"Response cache lookup failed: {e}")
+                entry = None
+            if entry is not None:
+                response_cache.count('hits')
+                response = app.response_class(base64.b64decode(entry['body']), status=entry['status'],
+                                              content_type=entry['content_type'])
+                response.headers['X-Cache'] = 'HIT'
+                return response
+            
+            response_cache.count('misses')
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                entry = {
+                    'body': base64.b64encode(response.get_data()).decode('ascii'),
+                    'status': response.status_code,
+                    'content_type': response.content_type
+                }
+                try:
+                    backend.set(key, entry, tags, ttl if ttl is not None else app.config['CACHE_TTL'])
+                    response_cache.count('stores')
+                except sqlite3.Error as e:
+                    logger.error(f"Response cache store failed: {e}")
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
+
+def versioned_etag(*tables, daily=False):
+    """Give GET responses a weak ETag built from the tables' change versions.
+
+    A matching If-None-Match is answered with 304 before the view (and its
+    query) runs. daily=True also folds in the UTC date, for views whose
+    results depend on date('now').
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET':
+                return view(*args, **kwargs)
+            
+            names = ('epoch',) + tables
+            rows = execute_query(
+                f"SELECT name, version FROM table_versions WHERE name IN ({', '.join('?' for _ in names)})",
+                names, fetch=True
+            )
+            if not rows:
+                return view(*args, **kwargs)
+            versions = {row['name']: row['version'] for row in rows}
+            etag = '.'.join(str(versions.get(name, 0)) for name in names)
+            if daily:
+                etag += '.' + time.strftime('%Y%m%d', time.gmtime())
+            g.version_etag = etag  # Keys cached_response entries to this version
+            
+            if request.if_none_match.contains_weak(etag):
+                response = app.response_class(status=304)
+            else:
+                response = app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
+
 # Routes (same as previous version but updated for foundation context)
 @app.route('/')
 def index():
-    """Serve the main website with embedded HTML"""
-    return HTML_CONTENT
+    """Serve the main website shell; repeat visitors get a 304"""
+    return serve_static_asset(HTML_SHELL, immutable=False)
+
+@app.route('/assets/<name>')
+def serve_asset(name):
+    """Serve fingerprinted CSS/JS extracted from the page"""
+    asset = STATIC_ASSETS.get(name)
+    if asset is None:
+        abort(404)
+    return serve_static_asset(asset, immutable=True)
 
 @app.route('/api/login', methods=['POST'])
 def handle_login():
@@ -2327,24 +4216,53 @@ def handle_logout():
     session.pop('user', None)
     return jsonify({'success': True})
 
+@app.route('/api/stream')
+def event_stream():
+    """Push dashboard deltas to a signed-in leader over Server-Sent Events"""
+    if 'user' not in session:
+        return jsonify({'success': False, 'error': 'Login required'}), 401
+    
+    last_event_id = request.headers.get('Last-Event-ID', request.args.get('last_event_id'))
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+    subscription = event_bus.subscribe(last_event_id)
+    heartbeat = app.config['SSE_HEARTBEAT_INTERVAL']
+    dumps = get_json_serializer().dumps
+    
+    def generate():
+        try:
+            yield b'retry: 5000\n\n'
+            while not subscription.closed:
+                try:
+                    event_id, kind, data = subscription.queue.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield b': keep-alive\n\n'
+                    continue
+                yield b'id: %d\nevent: %s\ndata: %s\n\n' % (event_id, kind.encode(), dumps(data))
+        finally:
+            event_bus.unsubscribe(subscription)
+    
+    response = app.response_class(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Keep nginx from buffering the stream
+    return response
+
 @app.route('/api/members', methods=['GET', 'POST'])
+@versioned_etag('members')
+@cached_response('members')
 def handle_members():
     """Handle member operations"""
     if request.method == 'GET':
-        members = execute_query(
-            'SELECT * FROM members WHERE active = 1 ORDER BY role DESC, name ASC',
-            fetch=True
-        )
+        try:
+            members, next_cursor, total_count = fetch_page('members', request.args)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
-        if members:
-            members_list = [dict(member) for member in members]
-            return jsonify({
-                'success': True,
-                'members': members_list,
-                'total_count': len(members_list)
-            })
-        else:
-            return jsonify({'success': True, 'members': [], 'total_count': 0})
+        if members is None:
+            return jsonify({'success': False, 'error': 'Failed to load volunteers'}), 500
+        return page_response('members', members, next_cursor, total_count)
     
     elif request.method == 'POST':
         data = request.get_json()
@@ -2367,6 +4285,11 @@ def handle_members():
         ))
         
         if member_id:
+            if data.get('skills'):
+                update_skill_tags('members', row_ids=[member_id])
+            response_cache.invalidate('members', 'stats')
+            event_bus.publish('member', {'id': member_id, 'name': data['name'],
+                                         'role': data.get('role', 'Volunteer')})
             return jsonify({
                 'success': True,
                 'message': 'Volunteer added successfully',
@@ -2375,25 +4298,39 @@ def handle_members():
         else:
             return jsonify({'success': False, 'error': 'Failed to add volunteer'}), 500
 
+def fetch_event_occurrences(args):
+    """fetch_page over event_occurrences for ?from=&to= (ISO dates, inclusive)"""
+    today = datetime.now(timezone.utc).date()
+    start = date.fromisoformat(args['from']) if args.get('from') else today
+    end = (date.fromisoformat(args['to']) if args.get('to')
+           else start + timedelta(days=app.config['EVENT_RANGE_DEFAULT_DAYS']))
+    if end < start:
+        raise ValueError('to must not be before from')
+    horizon = today + timedelta(days=app.config['EVENT_OCCURRENCE_HORIZON'])
+    if end > horizon:
+        raise ValueError(f'to must be on or before {horizon.isoformat()}')
+    
+    occurrence_horizon.ensure()
+    return fetch_page('event_occurrences', args,
+                      filters=[('occurrence_date BETWEEN ? AND ?', [start.isoformat(), end.isoformat()])])
+
 @app.route('/api/events', methods=['GET', 'POST'])
+@versioned_etag('events', daily=True)
+@cached_response('events')
 def handle_events():
     """Handle event operations"""
     if request.method == 'GET':
-        events = execute_query('''
-            SELECT * FROM events 
-            WHERE event_date >= date('now') 
-            ORDER BY event_date ASC
-        ''', fetch=True)
+        try:
+            if 'from' in request.args or 'to' in request.args:
+                events, next_cursor, total_count = fetch_event_occurrences(request.args)
+            else:
+                events, next_cursor, total_count = fetch_page('events', request.args)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
-        if events:
-            events_list = [dict(event) for event in events]
-            return jsonify({
-                'success': True,
-                'events': events_list,
-                'total_count': len(events_list)
-            })
-        else:
-            return jsonify({'success': True, 'events': [], 'total_count': 0})
+        if events is None:
+            return jsonify({'success': False, 'error': 'Failed to load events'}), 500
+        return page_response('events', events, next_cursor, total_count)
     
     elif request.method == 'POST':
         data = request.get_json()
@@ -2402,9 +4339,19 @@ def handle_events():
         if not all(field in data for field in required_fields):
             return jsonify({'success': False, 'error': 'Missing required fields'}), 400
         
+        rrule = data.get('rrule') or None
+        try:
+            date.fromisoformat(data['event_date'])
+            if rrule:
+                parse_rrule(rrule)
+        except (TypeError, ValueError) as e:
+            return jsonify({'success': False, 'error': f'Invalid event_date or rrule: {e}'}), 400
+        
+        required_skills = ', '.join(parse_skills(data.get('required_skills'))) or None
         event_id = execute_query('''
-            INSERT INTO events (title, description, event_date, event_time, location, category, max_participants, created_by)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            INSERT INTO events (title, description, event_date, event_time, location, category, max_participants,
+                                required_skills, rrule, created_by)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (
             data['title'],
             data.get('description'),
@@ -2413,10 +4360,19 @@ def handle_events():
             data.get('location'),
             data.get('category', 'Community Service'),
             data.get('max_participants'),
+            required_skills,
+            rrule,
             data.get('created_by', 'System')
         ))
         
         if event_id:
+            if required_skills:
+                update_skill_tags('events', row_ids=[event_id])
+            if rrule:
+                occurrence_horizon.ensure(force=True)
+            response_cache.invalidate('events', 'stats')
+            event_bus.publish('event', {'id': event_id, 'title': data['title'],
+                                        'event_date': data['event_date']})
             return jsonify({
                 'success': True,
                 'message': 'Event created successfully',
@@ -2425,18 +4381,766 @@ def handle_events():
         else:
             return jsonify({'success': False, 'error': 'Failed to create event'}), 500
 
+# Recurring events. events.rrule holds an RFC 5545 RRULE subset; occurrences
+# are expanded ahead of time into event_occurrences, up to a rolling horizon,
+# so date-range reads are an index seek instead of per-request rule expansion.
+RRULE_WEEKDAYS = {'MO': 0, 'TU': 1, 'WE': 2, 'TH': 3, 'FR': 4, 'SA': 5, 'SU': 6}
+RRULE_FREQUENCIES = ('DAILY', 'WEEKLY', 'MONTHLY', 'YEARLY')
+
+def parse_rrule(text):
+    """Parse FREQ/INTERVAL/COUNT/UNTIL/BYDAY/BYMONTHDAY into a dict, raising ValueError"""
+    rule = {'interval': 1, 'count': None, 'until': None, 'byday': [], 'bymonthday': []}
+    parts = str(text).strip().upper()
+    if parts.startswith('RRULE:'):
+        parts = parts[6:]
+    for part in filter(None, parts.split(';')):
+        key, _, value = part.partition('=')
+        if key == 'FREQ':
+            if value not in RRULE_FREQUENCIES:
+                raise ValueError(f'Unsupported FREQ: {value}')
+            rule['freq'] = value
+        elif key in ('INTERVAL', 'COUNT'):
+            if not value.isdigit() or int(value) < 1:
+                raise ValueError(f'{key} must be a positive integer')
+            rule[key.lower()] = int(value)
+        elif key == 'UNTIL':
+            try:
+                rule['until'] = datetime.strptime(value[:8], '%Y%m%d').date()
+            except ValueError:
+                raise ValueError('UNTIL must be YYYYMMDD')
+        elif key == 'BYDAY':
+            for day in value.split(','):
+                match = re.fullmatch(r'([+-]?[1-5])?(MO|TU|WE|TH|FR|SA|SU)', day)
+                if not match:
+                    raise ValueError(f'Invalid BYDAY: {day}')
+                rule['byday'].append((int(match.group(1)) if match.group(1) else None,
+                                      RRULE_WEEKDAYS[match.group(2)]))
+        elif key == 'BYMONTHDAY':
+            for day in value.split(','):
+                if not re.fullmatch(r'-?\d{1,2}', day) or not 1 <= abs(int(day)) <= 31:
+                    raise ValueError(f'Invalid BYMONTHDAY: {day}')
+                rule['bymonthday'].append(int(day))
+        else:
+            raise ValueError(f'Unsupported RRULE part: {key}')
+    if 'freq' not in rule:
+        raise ValueError('FREQ is required')
+    if rule['freq'] != 'MONTHLY' and (rule['bymonthday'] or any(n for n, _ in rule['byday'])):
+        raise ValueError('BYMONTHDAY and numbered BYDAY are only supported with FREQ=MONTHLY')
+    if rule['freq'] in ('DAILY', 'YEARLY') and rule['byday']:
+        raise ValueError(f"BYDAY is not supported with FREQ={rule['freq']}")
+    return rule
+
+def month_days(year, month, rule, dtstart):
+    """Dates a MONTHLY rule selects within one month"""
+    first = date(year, month, 1)
+    length = ((first.replace(day=28) + timedelta(days=4)).replace(day=1) - first).days
+    by_weekday = set()
+    for n, weekday in rule['byday']:
+        matches = [d for d in range(1, length + 1) if date(year, month, d).weekday() == weekday]
+        if n is None:
+            by_weekday.update(matches)
+        elif -len(matches) <= n <= len(matches) and n != 0:
+            by_weekday.add(matches[n - 1] if n > 0 else matches[n])
+    by_monthday = set()
+    for day in rule['bymonthday']:
+        day = day if day > 0 else length + day + 1
+        if 1 <= day <= length:
+            by_monthday.add(day)
+    if rule['byday'] and rule['bymonthday']:
+        days = by_weekday & by_monthday  # Both parts given: a day must match each, as in RFC 5545
+    elif rule['byday'] or rule['bymonthday']:
+        days = by_weekday | by_monthday
+    else:
+        days = {dtstart.day} if dtstart.day <= length else set()  # Short months are skipped, as in RFC 5545
+    return [date(year, month, d) for d in sorted(days)]
+
+def expand_rrule(rule, dtstart, window_end):
+    """Yield occurrence dates from dtstart through window_end, honoring COUNT and UNTIL"""
+    end = min(window_end, rule['until']) if rule['until'] else window_end
+    interval, emitted, period = rule['interval'], 0, 0
+    while True:
+        if rule['freq'] == 'DAILY':
+            candidates = [dtstart + timedelta(days=period * interval)]
+        elif rule['freq'] == 'WEEKLY':
+            week_start = dtstart - timedelta(days=dtstart.weekday()) + timedelta(weeks=period * interval)
+            weekdays = sorted({weekday for _, weekday in rule['byday']}) or [dtstart.weekday()]
+            candidates = [week_start + timedelta(days=weekday) for weekday in weekdays]
+        elif rule['freq'] == 'MONTHLY':
+            month_index = dtstart.year * 12 + dtstart.month - 1 + period * interval
+            candidates = month_days(month_index // 12, month_index % 12 + 1, rule, dtstart)
+        else:
+            year = dtstart.year + period * interval
+            try:
+                candidates = [dtstart.replace(year=year)]
+            except ValueError:
+                candidates = []  # Feb 29 start in a common year
+            if year > end.year:
+                return
+        
+        for day in candidates:
+            if day < dtstart:
+                continue
+            if day > end:
+                return
+            yield day
+            emitted += 1
+            if rule['count'] and emitted >= rule['count']:
+                return
+        period += 1
+        if rule['freq'] == 'MONTHLY' and date(month_index // 12, month_index % 12 + 1, 1) > end:
+            return
+
+def materialize_occurrences(today=None):
+    """Expand recurring events up to today + EVENT_OCCURRENCE_HORIZON days; returns rows added"""
+    today = today or datetime.now(timezone.utc).date()
+    horizon = (today + timedelta(days=app.config['EVENT_OCCURRENCE_HORIZON'])).isoformat()
+    added = 0
+    with get_db_connection() as conn:
+        events = conn.execute('''
+            SELECT id, event_date, event_time, rrule, occurrences_through FROM events
+            WHERE rrule IS NOT NULL AND (occurrences_through IS NULL OR occurrences_through < ?)
+        ''', (horizon,)).fetchall()
+        for event in events:
+            try:
+                rule = parse_rrule(event['rrule'])
+                dtstart = date.fromisoformat(event['event_date'])
+            except ValueError as e:
+                logger.error(f"Cannot expand recurrence of event {event['id']}: {e}")
+                continue
+            done = date.fromisoformat(event['occurrences_through']) if event['occurrences_through'] else None
+            rows = [(event['id'], day.isoformat(), event['event_time'])
+                    for day in expand_rrule(rule, dtstart, date.fromisoformat(horizon))
+                    if done is None or day > done]
+            conn.executemany('INSERT OR IGNORE INTO event_occurrences (event_id, occurrence_date, occurrence_time) '
+                             'VALUES (?, ?, ?)', rows)
+            conn.execute('UPDATE events SET occurrences_through = ? WHERE id = ?', (horizon, event['id']))
+            added += len(rows)
+        conn.commit()
+    if added:
+        logger.info(f"Materialized {added} occurrences for {len(events)} recurring events")
+    return added
+
+class OccurrenceHorizon:
+    """Rolls the materialized horizon forward at most once per day per process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._day = None
+
+    def ensure(self, force=False):
+        today = datetime.now(timezone.utc).date()
+        with self._lock:
+            if self._day == today and not force:
+                return
+            try:
+                materialize_occurrences(today)
+                self._day = today
+            except sqlite3.Error as e:
+                logger.error(f"Occurrence materialization failed: {e}")
+
+occurrence_horizon = OccurrenceHorizon()
+
+# Bulk imports: an NDJSON or CSV body is parsed as a stream, validated row by
+# row and inserted BULK_IMPORT_BATCH_SIZE rows per transaction.
+IMPORT_RESOURCES = {
+    'members': {
+        'table': 'members',
+        'columns': ('name', 'email', 'role', 'birthday', 'phone', 'address', 'skills'),
+        'required': ('name', 'email'),
+        'integers': (),
+        'defaults': {'role': 'Volunteer'},
+    },
+    'events': {
+        'table': 'events',
+        'columns': ('title', 'description', 'event_date', 'event_time', 'location', 'category',
+                    'max_participants', 'required_skills', 'rrule', 'created_by'),
+        'required': ('title', 'event_date'),
+        'integers': ('max_participants',),
+        'defaults': {'category': 'Community Service', 'created_by': 'System'},
+        'validators': {'event_date': date.fromisoformat, 'rrule': parse_rrule},
+    },
+}
+
+IMPORT_FORMATS = {'application/x-ndjson': 'ndjson', 'application/jsonl': 'ndjson', 'text/csv': 'csv'}
+
+def parse_import_stream(stream, import_format):
+    """Yield (line_number, record, error) for each row of an NDJSON or CSV stream"""
+    text = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    if import_format == 'csv':
+        reader = csv.DictReader(text)
+        for record in reader:
+            yield reader.line_num, record, None
+        return
+    for line_number, line in enumerate(text, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f'Invalid JSON: {e}'
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, 'Each line must be a JSON object'
+            continue
+        yield line_number, record, None
+
+def import_row_values(spec, record):
+    """Validate one import record; returns (values, error)"""
+    # CSV has no nulls, so empty cells mean "not given"
+    record = {key: value for key, value in record.items() if value not in ('', None)}
+    missing = [field for field in spec['required'] if field not in record]
+    if missing:
+        return None, f"Missing required fields: {', '.join(missing)}"
+    values = []
+    for column in spec['columns']:
+        value = record.get(column, spec['defaults'].get(column))
+        if isinstance(value, list):
+            value = ', '.join(str(item) for item in value)
+        elif isinstance(value, dict):
+            return None, f'{column} must be a single value'
+        validator = spec.get('validators', {}).get(column)
+        if validator and value is not None:
+            try:
+                validator(value)
+            except (TypeError, ValueError) as e:
+                return None, f'Invalid {column}: {e}'
+        if column in spec['integers'] and value is not None:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                return None, f'{column} must be an integer'
+            if not -2 ** 63 <= value < 2 ** 63:
+                return None, f'{column} is out of range'
+        values.append(value)
+    return values, None
+
+def bulk_import(resource, rows, result):
+    """Insert parsed rows in batched transactions, recording per-row errors in result"""
+    spec = IMPORT_RESOURCES[resource]
+    columns = spec['columns']
+    sql = (f"INSERT INTO {spec['table']} ({', '.join(columns)}) "
+           f"VALUES ({', '.join('?' for _ in columns)})")
+    max_errors = app.config['BULK_IMPORT_MAX_ERRORS']
+
+    def fail(line_number, error):
+        result['failed'] += 1
+        if len(result['errors']) < max_errors:
+            result['errors'].append({'line': line_number, 'error': error})
+
+    def flush(batch):
+        # Borrow a connection per batch only: the body is read and parsed at
+        # the client's pace, which must not hold a pool slot
+        with get_db_connection() as conn:
+            try:
+                conn.executemany(sql, [values for _, values in batch])
+                conn.commit()
+                result['inserted'] += len(batch)
+            except (sqlite3.Error, OverflowError):
+                # Redo the batch one row at a time so only the offending rows fail
+                conn.rollback()
+                for line_number, values in batch:
+                    try:
+                        conn.execute(sql, values)
+                        result['inserted'] += 1
+                    except (sqlite3.Error, OverflowError) as e:
+                        fail(line_number, str(e))
+                conn.commit()
+        # Every line up to here is either committed or listed in errors
+        result['last_committed_line'] = batch[-1][0]
+
+    batch = []
+    for line_number, record, error in rows:
+        if error is None:
+            values, error = import_row_values(spec, record)
+        if error is not None:
+            fail(line_number, error)
+            continue
+        batch.append((line_number, values))
+        if len(batch) >= app.config['BULK_IMPORT_BATCH_SIZE']:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    result['errors'].sort(key=lambda e: e['line'])
+    return result
+
+def handle_bulk_import(resource):
+    """Shared body of the bulk import routes"""
+    import_format = IMPORT_FORMATS.get(request.mimetype)
+    if import_format is None:
+        return jsonify({'success': False,
+                        'error': 'Content-Type must be application/x-ndjson or text/csv'}), 415
+    
+    request.max_content_length = app.config['BULK_IMPORT_MAX_SIZE']
+    result = {'inserted': 0, 'failed': 0, 'errors': [], 'last_committed_line': 0}
+    started = time.monotonic()
+    last_id = execute_query(f'SELECT COALESCE(MAX(id), 0) AS id FROM {resource}', fetch=True)
+    try:
+        bulk_import(resource, parse_import_stream(request.stream, import_format), result)
+    except (sqlite3.Error, UnicodeDecodeError, csv.Error) as e:
+        # Batches before the failure stay committed; report them as a partial import
+        logger.error(f"Bulk import of {resource} stopped after {result['inserted']} rows: {e}")
+        if result['inserted']:
+            status = 207
+        else:
+            status = 500 if isinstance(e, sqlite3.Error) else 400
+        return jsonify(dict(result, success=False, stopped=True, error=f'Import stopped: {e}',
+                            errors_truncated=result['failed'] > len(result['errors']))), status
+    finally:
+        if result['inserted']:
+            if last_id:
+                update_skill_tags(resource, after_id=last_id[0]['id'])
+            if resource == 'events':
+                occurrence_horizon.ensure(force=True)
+            response_cache.invalidate(resource, 'stats')
+            event_bus.publish(f'{resource}_imported', {'count': result['inserted']})
+    
+    elapsed = time.monotonic() - started
+    logger.info(f"Bulk imported {result['inserted']} {resource} ({result['failed']} failed) in {elapsed:.2f}s")
+    del result['last_committed_line']
+    return jsonify(dict(result, success=result['failed'] == 0,
+                        errors_truncated=result['failed'] > len(result['errors'])))
+
+class SkillIndex:
+    """Inverted index from skill id to a bitmap of active member ids.
+
+    Bitmaps are Python ints, so intersecting or counting skills across tens
+    of thousands of volunteers is a handful of big-int operations. The index
+    is rebuilt when the members or member_skills change versions move.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._postings = {}  # skill_id -> bitmap of member ids
+        self._active = 0
+
+    def _current_version(self, conn):
+        return tuple(conn.execute(
+            "SELECT version FROM table_versions WHERE name IN ('epoch', 'members', 'member_skills') ORDER BY name"
+        ).fetchall())
+
+    def _load(self, conn):
+        version = self._current_version(conn)
+        with self._lock:
+            if version == self._version:
+                return
+            postings = {}
+            for skill_id, member_id in conn.execute('SELECT skill_id, member_id FROM member_skills'):
+                postings[skill_id] = postings.get(skill_id, 0) | (1 << member_id)
+            active = 0
+            for (member_id,) in conn.execute('SELECT id FROM members WHERE active = 1'):
+                active |= 1 << member_id
+            self._postings, self._active, self._version = postings, active, version
+
+    def rank(self, conn, wanted_ids, limit):
+        """Return [(member_id, matched skill ids)] ordered by overlap, then id"""
+        self._load(conn)
+        bitmaps = [(skill_id, self._postings.get(skill_id, 0) & self._active) for skill_id in wanted_ids]
+        
+        # Bit-sliced counters: planes[i] holds bit i of each member's overlap count
+        planes = []
+        for _, bitmap in bitmaps:
+            carry = bitmap
+            for i, plane in enumerate(planes):
+                planes[i], carry = plane ^ carry, plane & carry
+                if not carry:
+                    break
+            if carry:
+                planes.append(carry)
+        
+        candidates = 0
+        for _, bitmap in bitmaps:
+            candidates |= bitmap
+        ranked = []
+        for overlap in range(len(bitmaps), 0, -1):
+            mask = candidates
+            for i, plane in enumerate(planes):
+                mask &= plane if overlap >> i & 1 else ~plane
+            candidates &= ~mask
+            while mask and len(ranked) < limit:
+                lowest = mask & -mask
+                member_id = lowest.bit_length() - 1
+                ranked.append((member_id, [skill_id for skill_id, bitmap in bitmaps if bitmap & lowest]))
+                mask ^= lowest
+            if len(ranked) >= limit:
+                break
+        return ranked
+
+skill_index = SkillIndex()
+
+@app.route('/api/members/match', methods=['GET'])
+def match_members():
+    """Rank active volunteers by how many of the wanted skills they have"""
+    wanted = parse_skills(request.args.get('skills', ''))
+    event_id = request.args.get('event_id')
+    try:
+        limit = int(request.args.get('limit', app.config['SKILL_MATCH_DEFAULT_LIMIT']))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'limit must be an integer'}), 400
+    limit = max(1, min(limit, app.config['SKILL_MATCH_MAX_LIMIT']))
+    
+    with get_db_connection() as conn:
+        wanted_ids = {}
+        if wanted:
+            placeholders = ', '.join('?' for _ in wanted)
+            wanted_ids.update((row['id'], row['name']) for row in conn.execute(
+                f'SELECT id, name FROM skills WHERE name_key IN ({placeholders})',
+                [skill_key(name) for name in wanted]))
+        if event_id:
+            event = conn.execute('SELECT id FROM events WHERE id = ?', (event_id,)).fetchone()
+            if event is None:
+                return jsonify({'success': False, 'error': 'Event not found'}), 404
+            wanted_ids.update((row['id'], row['name']) for row in conn.execute(
+                'SELECT s.id, s.name FROM event_skills es JOIN skills s ON s.id = es.skill_id WHERE es.event_id = ?',
+                (event_id,)))
+        if not wanted and not event_id:
+            return jsonify({'success': False, 'error': 'skills or event_id is required'}), 400
+        
+        candidates = []
+        ranked = skill_index.rank(conn, list(wanted_ids), limit) if wanted_ids else []
+        if ranked:
+            placeholders = ', '.join('?' for _ in ranked)
+            members = {row['id']: row for row in conn.execute(
+                f'SELECT id, name, email, role FROM members WHERE id IN ({placeholders})',
+                [member_id for member_id, _ in ranked])}
+            for member_id, matched_ids in ranked:
+                member = members.get(member_id)
+                if member is None:
+                    continue
+                matched = [wanted_ids[skill_id] for skill_id in matched_ids]
+                candidates.append({
+                    'id': member_id,
+                    'name': member['name'],
+                    'email': member['email'],
+                    'role': member['role'],
+                    'matched_skills': sorted(matched),
+                    'missing_skills': sorted(set(wanted_ids.values()) - set(matched)),
+                    'score': round(len(matched_ids) / len(wanted_ids), 3)
+                })
+    
+    unknown = sorted({skill_key(name) for name in wanted} - {skill_key(name) for name in wanted_ids.values()})
+    return json_response({
+        'success': True,
+        'skills': sorted(wanted_ids.values()),
+        'unknown_skills': unknown,
+        'candidates': candidates
+    })
+
+# Event registrations. Seats are taken with one conditional UPDATE inside an
+# IMMEDIATE transaction, so concurrent signups can never push
+# current_participants past max_participants; the rest join the waitlist.
+def registration_summary(conn, registration_id):
+    row = conn.execute('SELECT * FROM event_registrations WHERE id = ?', (registration_id,)).fetchone()
+    summary = {'id': row['id'], 'event_id': row['event_id'], 'email': row['email'], 'status': row['status']}
+    if row['status'] == 'waitlisted':
+        summary['waitlist_position'] = conn.execute('''
+            SELECT COUNT(*) FROM event_registrations
+            WHERE event_id = ? AND status = 'waitlisted' AND id <= ?
+        ''', (row['event_id'], row['id'])).fetchone()[0]
+    return summary
+
+def cancel_token_hash(token):
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+def register_for_event(event_id, email, name=None):
+    """Take a seat or a waitlist place; returns (summary, created) or None if the event is missing.
+
+    A new registration's summary carries its cancel_token, which is shown only this once.
+    """
+    now = time.time()
+    token = secrets.token_urlsafe(24)
+    with get_db_connection() as conn:
+        conn.execute('BEGIN IMMEDIATE')
+        existing = conn.execute('''
+            SELECT id FROM event_registrations
+            WHERE event_id = ? AND email = ? AND status != 'cancelled'
+        ''', (event_id, email)).fetchone()
+        if existing:
+            conn.rollback()
+            return registration_summary(conn, existing['id']), False
+        
+        seated = conn.execute('''
+            UPDATE events SET current_participants = COALESCE(current_participants, 0) + 1
+            WHERE id = ? AND (max_participants IS NULL OR COALESCE(current_participants, 0) < max_participants)
+        ''', (event_id,)).rowcount == 1
+        if not seated and conn.execute('SELECT 1 FROM events WHERE id = ?', (event_id,)).fetchone() is None:
+            conn.rollback()
+            return None
+        
+        cursor = conn.execute('''
+            INSERT INTO event_registrations (event_id, email, name, status, created_at, updated_at,
+                                             cancel_token_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (event_id, email, name, 'confirmed' if seated else 'waitlisted', now, now, cancel_token_hash(token)))
+        conn.commit()
+        return dict(registration_summary(conn, cursor.lastrowid), cancel_token=token), True
+
+def cancel_registration(event_id, email, token=None):
+    """Cancel a registration, handing a freed seat to the oldest waitlisted one.
+
+    Unless token is None (a leader acting), it must match the registration's
+    cancel token. Returns (cancelled, promoted) summaries, or None if there
+    is no such registration or the token is wrong.
+    """
+    now = time.time()
+    with get_db_connection() as conn:
+        conn.execute('BEGIN IMMEDIATE')
+        registration = conn.execute('''
+            SELECT id, status, cancel_token_hash FROM event_registrations
+            WHERE event_id = ? AND email = ? AND status != 'cancelled'
+        ''', (event_id, email)).fetchone()
+        if registration is None or (token is not None and not secrets.compare_digest(
+                registration['cancel_token_hash'] or '', cancel_token_hash(token))):
+            conn.rollback()
+            return None
+        
+        conn.execute("UPDATE event_registrations SET status = 'cancelled', updated_at = ? WHERE id = ?",
+                     (now, registration['id']))
+        promoted = None
+        if registration['status'] == 'confirmed':
+            waiting = conn.execute('''
+                SELECT id FROM event_registrations
+                WHERE event_id = ? AND status = 'waitlisted'
+                ORDER BY id LIMIT 1
+            ''', (event_id,)).fetchone()
+            if waiting:
+                # The seat changes hands; current_participants is unchanged
+                conn.execute("UPDATE event_registrations SET status = 'confirmed', updated_at = ? WHERE id = ?",
+                             (now, waiting['id']))
+                promoted = waiting['id']
+            else:
+                conn.execute('''
+                    UPDATE events SET current_participants = MAX(COALESCE(current_participants, 0) - 1, 0)
+                    WHERE id = ?
+                ''', (event_id,))
+        conn.commit()
+        return (registration_summary(conn, registration['id']),
+                registration_summary(conn, promoted) if promoted else None)
+
+@app.route('/api/events/<int:event_id>/register', methods=['POST', 'DELETE'])
+def handle_event_registration(event_id):
+    """Register for an event (POST) or cancel a registration (DELETE)"""
+    data = request.get_json(silent=True) or {}
+    email = str(data.get('email') or request.args.get('email', '')).strip().lower()
+    if '@' not in email:
+        return jsonify({'success': False, 'error': 'A valid email address is required'}), 400
+    
+    # Cancelling takes the token returned at signup, or a signed-in leader
+    token = data.get('cancel_token') or request.args.get('cancel_token')
+    if request.method == 'DELETE' and 'user' not in session:
+        if not isinstance(token, str) or not token:
+            return jsonify({'success': False, 'error': 'cancel_token is required'}), 401
+    else:
+        token = None
+    
+    try:
+        if request.method == 'POST':
+            registered = register_for_event(event_id, email, data.get('name'))
+            if registered is None:
+                return jsonify({'success': False, 'error': 'Event not found'}), 404
+            registration, created = registered
+            if created:
+                response_cache.invalidate('events')
+                event_bus.publish('registration', {'event_id': event_id, 'status': registration['status']})
+            return jsonify({'success': True, 'registration': registration}), 201 if created else 200
+        
+        cancelled = cancel_registration(event_id, email, token)
+        if cancelled is None:
+            return jsonify({'success': False, 'error': 'Registration not found'}), 404
+        registration, promoted = cancelled
+        response_cache.invalidate('events')
+        return jsonify({'success': True, 'registration': registration, 'promoted': promoted})
+    except sqlite3.Error as e:
+        logger.error(f"Registration for event {event_id} failed: {e}")
+        return jsonify({'success': False, 'error': 'Registration failed, please retry'}), 503
+
+def load_test_registrations(attendees=500, capacity=100, workers=32):
+    """Hammer one event with concurrent signups and cancellations in a scratch database.
+
+    Returns a report dict; 'ok' is False if the event was ever overbooked or
+    the seat count disagrees with the confirmed registrations.
+    """
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+    
+    original_path = app.config['DATABASE_PATH']
+    with tempfile.TemporaryDirectory() as scratch:
+        app.config['DATABASE_PATH'] = os.path.join(scratch, 'load_test.db')
+        try:
+            init_database()
+            event_id = execute_query(
+                'INSERT INTO events (title, event_date, max_participants) VALUES (?, ?, ?)',
+                ('Load test voyage', '2099-01-01', capacity)
+            )
+            client = app.test_client()
+            
+            tokens = {}
+            
+            def register(i):
+                response = client.post(f'/api/events/{event_id}/register', json={'email': f'crew{i}@example.org'})
+                tokens[i] = (response.get_json().get('registration') or {}).get('cancel_token')
+                return response.status_code
+            
+            def cancel(i):
+                return client.delete(f'/api/events/{event_id}/register',
+                                     json={'email': f'crew{i}@example.org', 'cancel_token': tokens[i]}).status_code
+            
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                statuses = list(pool.map(register, range(attendees)))
+                # Cancel a quarter of the confirmed seats while more people sign up
+                cancels = list(pool.map(cancel, range(0, capacity, 4)))
+                statuses += list(pool.map(register, range(attendees, attendees + capacity)))
+            elapsed = time.perf_counter() - started
+            
+            with get_db_connection() as conn:
+                seats, limit = conn.execute('SELECT current_participants, max_participants FROM events WHERE id = ?',
+                                            (event_id,)).fetchone()
+                counts = dict(conn.execute('''
+                    SELECT status, COUNT(*) FROM event_registrations WHERE event_id = ? GROUP BY status
+                ''', (event_id,)).fetchall())
+        finally:
+            get_db_pool().close_all()
+            app.config['DATABASE_PATH'] = original_path
+    
+    requests_made = len(statuses) + len(cancels)
+    return {
+        'ok': seats <= limit and seats == counts.get('confirmed', 0) and all(s in (200, 201) for s in statuses),
+        'requests': requests_made,
+        'requests_per_second': round(requests_made / elapsed),
+        'capacity': limit,
+        'current_participants': seats,
+        'registrations': counts,
+        'errors': sum(1 for s in statuses + cancels if s not in (200, 201))
+    }
+
+# Upcoming birthdays, looked up by day-of-year ranges on members.birthday_doy
+def leap_calendar_doy(day):
+    """Day of year of a date's month and day on the 2000 calendar"""
+    return date(2000, day.month, day.day).timetuple().tm_yday
+
+def next_birthday(birthday, today):
+    """Next celebration on or after today; Feb 29 birthdays fall on Feb 28 in common years"""
+    month, day = int(birthday[5:7]), int(birthday[8:10])
+    for year in (today.year, today.year + 1):
+        if (month, day) == (2, 29) and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+            candidate = date(year, 2, 28)
+        else:
+            candidate = date(year, month, day)
+        if candidate >= today:
+            return candidate
+
+def upcoming_birthdays(conn, today, window):
+    """Active members celebrating between today and today + window days"""
+    end = today + timedelta(days=window)
+    start_doy, end_doy = leap_calendar_doy(today), leap_calendar_doy(end)
+    if (end.month, end.day) == (2, 28):
+        end_doy = 60  # In a common year Feb 29 birthdays are celebrated on the 28th
+    if window >= 365:
+        ranges = [(1, 366)]
+    elif start_doy <= end_doy:
+        ranges = [(start_doy, end_doy)]
+    else:
+        ranges = [(start_doy, 366), (1, end_doy)]  # Window wraps past Dec 31
+    
+    birthdays = []
+    for low, high in ranges:
+        for row in conn.execute(BIRTHDAY_RANGE_SQL, (low, high)):
+            try:
+                upcoming = next_birthday(row['birthday'], today)
+            except ValueError:
+                continue  # e.g. 1990-02-30
+            days_until = (upcoming - today).days
+            if days_until > window:
+                continue
+            try:
+                turning = upcoming.year - int(row['birthday'][:4])
+            except ValueError:
+                turning = None
+            birthdays.append({
+                'id': row['id'],
+                'name': row['name'],
+                'role': row['role'],
+                'birthday': row['birthday'],
+                'next_birthday': upcoming.isoformat(),
+                'days_until': days_until,
+                'turning': turning
+            })
+    birthdays.sort(key=lambda b: (b['days_until'], b['name']))
+    return birthdays
+
+class BirthdayDigest:
+    """Once-a-day precomputed list of upcoming birthdays.
+
+    The digest covers BIRTHDAY_DIGEST_WINDOW days and is rebuilt when the
+    date or the members change version moves; shorter windows are slices of it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key = None
+        self._birthdays = []
+
+    def upcoming(self, conn, today, window):
+        digest_window = app.config['BIRTHDAY_DIGEST_WINDOW']
+        if window > digest_window:
+            return upcoming_birthdays(conn, today, window)
+        
+        version = tuple(row[0] for row in conn.execute(
+            "SELECT version FROM table_versions WHERE name IN ('epoch', 'members') ORDER BY name"))
+        key = (today, digest_window, version)
+        with self._lock:
+            if key != self._key:
+                self._birthdays = upcoming_birthdays(conn, today, digest_window)
+                self._key = key
+            birthdays = self._birthdays
+        return [b for b in birthdays if b['days_until'] <= window]
+
+birthday_digest = BirthdayDigest()
+
+@app.route('/api/members/birthdays', methods=['GET'])
+@versioned_etag('members', daily=True)
+def member_birthdays():
+    """Active volunteers with a birthday in the next ?window= days"""
+    try:
+        window = int(request.args.get('window', app.config['BIRTHDAY_DEFAULT_WINDOW']))
+        today = request.args.get('today')
+        # Same UTC day boundary as the daily ETag
+        today = date.fromisoformat(today) if today else datetime.now(timezone.utc).date()
+    except ValueError:
+        return jsonify({'success': False, 'error': 'window must be an integer and today YYYY-MM-DD'}), 400
+    window = max(0, min(window, app.config['BIRTHDAY_MAX_WINDOW']))
+    
+    with get_db_connection() as conn:
+        birthdays = birthday_digest.upcoming(conn, today, window)
+    return json_response({
+        'success': True,
+        'today': today.isoformat(),
+        'window': window,
+        'birthdays': birthdays
+    })
+
+@app.route('/api/members/bulk', methods=['POST'])
+def bulk_import_members():
+    """Import many volunteers from an NDJSON or CSV stream"""
+    return handle_bulk_import('members')
+
+@app.route('/api/events/bulk', methods=['POST'])
+def bulk_import_events():
+    """Import many events from an NDJSON or CSV stream"""
+    return handle_bulk_import('events')
+
 @app.route('/api/contact', methods=['GET', 'POST'])
+@versioned_etag('contact_messages')
 def handle_contact():
     """Handle contact form submissions and retrieval"""
     if request.method == 'GET':
-        messages = execute_query(
-            'SELECT * FROM contact_messages ORDER BY created_at DESC LIMIT 50',
-            fetch=True
-        )
+        messages = execute_query(CONTACT_LIST_SQL, fetch=True)
         
         if messages:
             messages_list = [dict(message) for message in messages]
-            return jsonify({
+            return json_response({
                 'success': True,
                 'messages': messages_list,
                 'total_count': len(messages_list)
@@ -2445,19 +5149,26 @@ def handle_contact():
             return jsonify({'success': True, 'messages': [], 'total_count': 0})
     
     elif request.method == 'POST':
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         
+        # Queued rows are written later in a shared batch, so anything that
+        # would violate NOT NULL has to be rejected here, per request
         required_fields = ['name', 'email', 'message']
-        if not all(field in data for field in required_fields):
+        if not all(isinstance(data.get(field), str) and data[field].strip() for field in required_fields):
             return jsonify({'success': False, 'error': 'Missing required fields'}), 400
+        subject = data.get('subject') or 'General Inquiry'
+        if not isinstance(subject, str):
+            return jsonify({'success': False, 'error': 'subject must be a string'}), 400
         
-        message_id = execute_query('''
-            INSERT INTO contact_messages (name, email, subject, message)
-            VALUES (?, ?, ?, ?)
-        ''', (data['name'], data['email'], data.get('subject', 'General Inquiry'), data['message']))
+        status = write_behind.submit('contact_message', (
+            data['name'], data['email'], subject, data['message']
+        ))
         
-        if message_id:
+        if status == 'pending':
+            return jsonify({'success': True, 'pending': True, 'message': 'Message accepted'}), 202
+        elif status == 'stored':
             logger.info(f"Contact message received from {data['name']} ({data['email']})")
+            event_bus.publish('contact', {'name': data['name'], 'email': data['email'], 'subject': subject})
             return jsonify({
                 'success': True,
                 'message': 'Message sent successfully'
@@ -2465,29 +5176,110 @@ def handle_contact():
         else:
             return jsonify({'success': False, 'error': 'Failed to send message'}), 500
 
+@app.route('/api/newsletter', methods=['POST'])
+def handle_newsletter():
+    """Subscribe an email address to the newsletter"""
+    data = request.get_json(silent=True) or {}
+    email = str(data.get('email', '')).strip().lower()
+    
+    if '@' not in email:
+        return jsonify({'success': False, 'error': 'A valid email address is required'}), 400
+    
+    status = write_behind.submit('newsletter_subscription', (email,))
+    if status == 'pending':
+        return jsonify({'success': True, 'pending': True, 'message': 'Subscription accepted'}), 202
+    elif status == 'stored':
+        return jsonify({'success': True, 'message': 'Subscribed successfully'})
+    else:
+        return jsonify({'success': False, 'error': 'Failed to subscribe'}), 500
+
+# Streaming exports: rows are read in fixed-size batches from one cursor and
+# written out as they arrive, so memory use does not grow with the table.
+EXPORT_TABLES = {
+    'members': ('id', 'name', 'email', 'role', 'join_date', 'birthday', 'phone',
+                'address', 'skills', 'active', 'created_at'),
+    'events': ('id', 'title', 'description', 'event_date', 'event_time', 'location', 'category',
+               'max_participants', 'current_participants', 'required_skills', 'rrule', 'created_by',
+               'created_at'),
+    'contact_messages': ('id', 'name', 'email', 'subject', 'message', 'status', 'created_at'),
+}
+
+EXPORT_FORMATS = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv; charset=utf-8'}
+
+def export_rows(table):
+    """Yield batches of rows from a table in primary key order"""
+    columns = EXPORT_TABLES[table]
+    # A download lasts as long as the client takes to read it, so it gets its
+    # own connection; slow exports must not hold pooled connections
+    conn = sqlite3.connect(app.config['DATABASE_PATH'], timeout=app.config['DB_BUSY_TIMEOUT'] / 1000,
+                           check_same_thread=False)
+    with closing(conn):
+        configure_connection(conn)
+        cursor = conn.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(app.config['EXPORT_BATCH_SIZE'])
+            if not rows:
+                break
+            yield rows
+
+def generate_ndjson(table):
+    dumps = get_json_serializer().dumps
+    columns = EXPORT_TABLES[table]
+    for rows in export_rows(table):
+        yield b''.join(dumps(dict(zip(columns, row))) + b'\n' for row in rows)
+
+def generate_csv(table):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_TABLES[table])
+    for rows in export_rows(table):
+        writer.writerows(rows)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    # Header-only output for an empty table
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+@app.route('/api/export/<table>', methods=['GET'])
+def export_table(table):
+    """Stream a whole table as NDJSON (default) or CSV to a signed-in leader"""
+    if 'user' not in session:
+        return jsonify({'success': False, 'error': 'Login required'}), 401
+    
+    if table not in EXPORT_TABLES:
+        return jsonify({'success': False, 'error': f'Unknown export table: {table}'}), 404
+    
+    export_format = request.args.get('format', 'ndjson').lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'success': False, 'error': 'format must be ndjson or csv'}), 400
+    
+    generate = generate_csv if export_format == 'csv' else generate_ndjson
+    logger.info(f"Exporting {table} as {export_format}")
+    response = app.response_class(generate(table), mimetype=EXPORT_FORMATS[export_format])
+    response.headers['Content-Disposition'] = f'attachment; filename={table}.{export_format}'
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
 @app.route('/api/gallery', methods=['GET'])
+@versioned_etag('gallery_items')
+@cached_response('gallery')
 def handle_gallery():
     """Handle gallery retrieval"""
-    gallery_items = execute_query(
-        'SELECT * FROM gallery_items ORDER BY created_at DESC',
-        fetch=True
-    )
+    def add_media_type(item, row):
+        # Determine if it's a video or image
+        item['type'] = 'video' if (row['file_type'] or '').startswith('video/') else 'image'
+        if 'variants' in item:
+            item['variants'] = json.loads(item['variants']) if item['variants'] else []
     
-    if gallery_items:
-        items_list = []
-        for item in gallery_items:
-            item_dict = dict(item)
-            # Determine if it's a video or image
-            item_dict['type'] = 'video' if item_dict['file_type'].startswith('video/') else 'image'
-            items_list.append(item_dict)
-        
-        return jsonify({
-            'success': True,
-            'items': items_list,
-            'total_count': len(items_list)
-        })
-    else:
-        return jsonify({'success': True, 'items': [], 'total_count': 0})
+    try:
+        items, next_cursor, total_count = fetch_page('gallery_items', request.args, add_media_type)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    if items is None:
+        return jsonify({'success': False, 'error': 'Failed to load gallery'}), 500
+    return page_response('items', items, next_cursor, total_count)
 
 @app.route('/api/gallery/upload', methods=['POST'])
 def handle_gallery_upload():
@@ -2500,87 +5292,654 @@ def handle_gallery_upload():
         return jsonify({'success': False, 'error': 'No file selected'}), 400
     
     if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        # Add timestamp to avoid conflicts
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_')
-        filename = timestamp + filename
+        original_name = secure_filename(file.filename)
+        extension = original_name.rsplit('.', 1)[1].lower()
         
-        file_path = os.path.join(app.config['GALLERY_FOLDER'], filename)
-        file.save(file_path)
+        # Hash while streaming to disk; identical content is stored once
+        content_hash, duplicate = store_blob_from_stream(file.stream, extension)
         
-        # Get file type
-        file_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
-        
-        # Save to database
-        gallery_id = execute_query('''
-            INSERT INTO gallery_items (title, description, filename, file_type, category, uploaded_by)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            request.form.get('title', filename),
-            request.form.get('description', ''),
-            filename,
-            file_type,
-            request.form.get('category', 'Impact'),
-            request.form.get('uploaded_by', 'Unknown')
-        ))
-        
-        if gallery_id:
+        saved = save_gallery_item(content_hash, extension, original_name, request.form)
+        if saved:
+            gallery_id, job_id = saved
             return jsonify({
                 'success': True,
                 'message': 'File uploaded successfully',
-                'gallery_id': gallery_id
+                'gallery_id': gallery_id,
+                'job_id': job_id,
+                'duplicate': duplicate
             })
         else:
-            # Clean up file if database insert failed
-            os.remove(file_path)
             return jsonify({'success': False, 'error': 'Failed to save file info'}), 500
     
     return jsonify({'success': False, 'error': 'Invalid file type'}), 400
 
-@app.route('/gallery/<filename>')
-def serve_gallery_file(filename):
-    """Serve gallery files"""
+def save_gallery_item(content_hash, extension, original_name, meta):
+    """Record a stored blob in gallery_items and queue its processing.
+
+    Returns (gallery_id, job_id), or None if the database insert failed, in
+    which case the blob is left for the garbage collector: a concurrent
+    upload of the same content may already be referencing it.
+    """
+    filename = blob_filename(content_hash, extension)
+    # Get file type
+    file_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    
+    # Save to database
+    gallery_id = execute_query('''
+        INSERT INTO gallery_items (title, description, filename, file_type, category, uploaded_by, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        meta.get('title', original_name),
+        meta.get('description', ''),
+        filename,
+        file_type,
+        meta.get('category', 'Impact'),
+        meta.get('uploaded_by', 'Unknown'),
+        content_hash
+    ))
+    
+    if not gallery_id:
+        enqueue_job('collect_blob', {'content_hash': content_hash, 'extension': extension},
+                    delay=app.config['BLOB_GC_GRACE_SECONDS'])
+        return None
+    
+    response_cache.invalidate('gallery', 'stats')
+    event_bus.publish('gallery', {'id': gallery_id, 'title': meta.get('title', original_name),
+                                  'filename': filename})
+    
+    # Resizing happens on the job queue, not in the request
+    job_id = enqueue_job('process_gallery_item', {
+        'gallery_id': gallery_id,
+        'path': blob_path(content_hash, extension),
+        'content_hash': content_hash,
+        'file_type': file_type
+    })
+    return gallery_id, job_id
+
+# Content-addressed gallery storage: gallery/objects/ab/cd/<sha256>.<ext>.
+# A blob's reference count is the number of gallery_items rows with its content_hash.
+CONTENT_ADDRESSED_FILENAME = re.compile(r'^([0-9a-f]{64})\.([a-z0-9]+)$')
+
+def blob_filename(content_hash, extension):
+    return f'{content_hash}.{extension}'
+
+def blob_path(content_hash, extension):
+    """Sharded location of a blob inside GALLERY_FOLDER"""
+    return os.path.join(app.config['GALLERY_FOLDER'], 'objects', content_hash[:2], content_hash[2:4],
+                        blob_filename(content_hash, extension))
+
+def store_blob(temp_path, content_hash, extension):
+    """Move a hashed temporary file into the blob store.
+
+    Returns True if the content was already stored, in which case the
+    temporary file is discarded.
+    """
+    path = blob_path(content_hash, extension)
+    if os.path.exists(path):
+        os.remove(temp_path)
+        # Refresh mtime so the GC grace period covers the new reference
+        os.utime(path)
+        return True
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    shutil.move(temp_path, path)
+    return False
+
+def store_blob_from_stream(stream, extension):
+    """Stream an upload to a temp file while hashing, then store it; returns (hash, duplicate)"""
+    temp_path = os.path.join(app.config['UPLOAD_FOLDER'], f'{secrets.token_hex(16)}.tmp')
+    sha = hashlib.sha256()
+    try:
+        with open(temp_path, 'wb') as f:
+            for block in iter(lambda: stream.read(64 * 1024), b''):
+                sha.update(block)
+                f.write(block)
+    except Exception:
+        os.remove(temp_path)
+        raise
+    content_hash = sha.hexdigest()
+    return content_hash, store_blob(temp_path, content_hash, extension)
+
+def blob_reference_count(content_hash):
+    rows = execute_query('SELECT COUNT(*) AS count FROM gallery_items WHERE content_hash = ?',
+                         (content_hash,), fetch=True)
+    return rows[0]['count'] if rows else None
+
+def collect_blob(content_hash, extension, grace_seconds):
+    """Delete a blob and its derivatives if nothing references it; returns True if removed"""
+    path = blob_path(content_hash, extension)
+    try:
+        age = time.time() - os.path.getmtime(path)
+    except FileNotFoundError:
+        return False
+    if age < grace_seconds or blob_reference_count(content_hash) != 0:
+        return False
+    
+    os.remove(path)
+    derivatives = get_derivatives_folder()
+    for name in os.listdir(derivatives):
+        if name.startswith(f'{content_hash}_w'):
+            os.remove(os.path.join(derivatives, name))
+    logger.info(f"Garbage collected orphaned blob {content_hash}")
+    return True
+
+def collect_orphaned_blobs(grace_seconds=None):
+    """Sweep the blob store for unreferenced blobs; returns how many were removed"""
+    if grace_seconds is None:
+        grace_seconds = app.config['BLOB_GC_GRACE_SECONDS']
+    objects = os.path.join(app.config['GALLERY_FOLDER'], 'objects')
+    removed = 0
+    for root, _, files in os.walk(objects):
+        for name in files:
+            match = CONTENT_ADDRESSED_FILENAME.match(name)
+            if match and collect_blob(match.group(1), match.group(2), grace_seconds):
+                removed += 1
+    return removed
+
+@job_handler('collect_blob')
+def collect_blob_job(payload, report_progress):
+    """Deferred cleanup for a blob whose gallery_items insert failed"""
+    removed = collect_blob(payload['content_hash'], payload['extension'], app.config['BLOB_GC_GRACE_SECONDS'])
+    return {'removed': removed}
+
+# Resumable chunked uploads: init -> PUT chunks at offsets -> complete with checksum.
+# The partial file on disk is the source of truth for how much has arrived.
+def upload_part_path(upload_id):
+    """Temporary file collecting the chunks of an upload session"""
+    return os.path.join(app.config['UPLOAD_FOLDER'], f'{upload_id}.part')
+
+def get_upload_session(upload_id):
+    sessions = execute_query('SELECT * FROM upload_sessions WHERE id = ?', (upload_id,), fetch=True)
+    return sessions[0] if sessions else None
+
+def remove_upload_session(upload_id):
+    execute_query('DELETE FROM upload_sessions WHERE id = ?', (upload_id,))
     try:
-        return send_file(os.path.join(app.config['GALLERY_FOLDER'], filename))
+        os.remove(upload_part_path(upload_id))
     except FileNotFoundError:
+        pass
+    release_upload_lock(upload_id)
+
+def cleanup_stale_uploads():
+    """Drop upload sessions that have not received data within the expiry window"""
+    cutoff = time.time() - app.config['CHUNKED_UPLOAD_EXPIRY']
+    stale = execute_query('SELECT id FROM upload_sessions WHERE updated_at < ?', (cutoff,), fetch=True)
+    for session_row in stale or []:
+        remove_upload_session(session_row['id'])
+
+def upload_status(session_row, offset):
+    return {
+        'upload_id': session_row['id'],
+        'filename': session_row['filename'],
+        'size': session_row['size'],
+        'offset': offset,
+        'complete': offset == session_row['size'],
+        'chunk_size': app.config['CHUNKED_UPLOAD_CHUNK_SIZE']
+    }
+
+@app.route('/api/gallery/uploads', methods=['POST'])
+def init_chunked_upload():
+    """Start a resumable upload session"""
+    data = request.get_json() or {}
+    
+    if not all(field in data for field in ['filename', 'size']):
+        return jsonify({'success': False, 'error': 'Missing required fields'}), 400
+    if not allowed_file(data['filename']):
+        return jsonify({'success': False, 'error': 'Invalid file type'}), 400
+    if not isinstance(data['size'], int) or not 0 < data['size'] <= app.config['CHUNKED_UPLOAD_MAX_SIZE']:
+        return jsonify({'success': False, 'error': 'Invalid file size'}), 400
+    
+    cleanup_stale_uploads()
+    
+    upload_id = secrets.token_urlsafe(16)
+    metadata = {key: data[key] for key in ('title', 'description', 'category', 'uploaded_by') if key in data}
+    now = time.time()
+    open(upload_part_path(upload_id), 'wb').close()
+    if execute_query('''
+        INSERT INTO upload_sessions (id, filename, size, sha256, metadata, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (upload_id, data['filename'], data['size'], data.get('sha256'), json.dumps(metadata), now, now)) is None:
+        os.remove(upload_part_path(upload_id))
+        return jsonify({'success': False, 'error': 'Failed to start upload'}), 500
+    
+    session_row = get_upload_session(upload_id)
+    return jsonify({'success': True, 'upload': upload_status(session_row, 0)}), 201
+
+@app.route('/api/gallery/uploads/<upload_id>', methods=['GET', 'PUT'])
+def handle_chunked_upload(upload_id):
+    """Report the resume offset (GET) or append a chunk at ?offset= (PUT)"""
+    session_row = get_upload_session(upload_id)
+    part_path = upload_part_path(upload_id)
+    if session_row is None or not os.path.exists(part_path):
+        return jsonify({'success': False, 'error': 'Upload not found'}), 404
+    
+    if request.method == 'GET':
+        return jsonify({'success': True, 'upload': upload_status(session_row, os.path.getsize(part_path))})
+    
+    offset = request.args.get('offset', type=int)
+    if offset is None:
+        return jsonify({'success': False, 'error': 'Missing offset'}), 400
+    
+    with upload_chunk_lock(upload_id):
+        current = os.path.getsize(part_path)
+        if offset != current:
+            # Client and server disagree; the client should resume from our offset
+            return jsonify({
+                'success': False,
+                'error': 'Offset mismatch',
+                'upload': upload_status(session_row, current)
+            }), 409
+        
+        if request.content_length is not None and offset + request.content_length > session_row['size']:
+            return jsonify({'success': False, 'error': 'Chunk exceeds declared size'}), 413
+        
+        # Stream the body straight to disk in small blocks
+        written = 0
+        with open(part_path, 'r+b') as f:
+            f.seek(offset)
+            while True:
+                block = request.stream.read(64 * 1024)
+                if not block:
+                    break
+                if offset + written + len(block) > session_row['size']:
+                    f.truncate(offset + written)
+                    return jsonify({'success': False, 'error': 'Chunk exceeds declared size'}), 413
+                f.write(block)
+                written += len(block)
+        
+        execute_query('UPDATE upload_sessions SET updated_at = ? WHERE id = ?', (time.time(), upload_id))
+        return jsonify({'success': True, 'upload': upload_status(session_row, offset + written)})
+
+@app.route('/api/gallery/uploads/<upload_id>/complete', methods=['POST'])
+def complete_chunked_upload(upload_id):
+    """Verify the checksum of a fully received upload and add it to the gallery"""
+    session_row = get_upload_session(upload_id)
+    part_path = upload_part_path(upload_id)
+    if session_row is None or not os.path.exists(part_path):
+        return jsonify({'success': False, 'error': 'Upload not found'}), 404
+    
+    data = request.get_json(silent=True) or {}
+    expected = (data.get('sha256') or session_row['sha256'] or '').lower()
+    if not expected:
+        return jsonify({'success': False, 'error': 'Missing sha256 checksum'}), 400
+    
+    with upload_chunk_lock(upload_id):
+        received = os.path.getsize(part_path)
+        if received != session_row['size']:
+            return jsonify({
+                'success': False,
+                'error': 'Upload incomplete',
+                'upload': upload_status(session_row, received)
+            }), 409
+        
+        actual = file_sha256(part_path)
+        if actual != expected:
+            # Corrupt data cannot be resumed; start the session over
+            remove_upload_session(upload_id)
+            return jsonify({'success': False, 'error': 'Checksum mismatch'}), 422
+        
+        original_name = secure_filename(session_row['filename'])
+        extension = original_name.rsplit('.', 1)[1].lower()
+        duplicate = store_blob(part_path, actual, extension)
+        execute_query('DELETE FROM upload_sessions WHERE id = ?', (upload_id,))
+    release_upload_lock(upload_id)
+    
+    metadata = json.loads(session_row['metadata'] or '{}')
+    saved = save_gallery_item(actual, extension, original_name, metadata)
+    if not saved:
+        return jsonify({'success': False, 'error': 'Failed to save file info'}), 500
+    
+    gallery_id, job_id = saved
+    return jsonify({
+        'success': True,
+        'message': 'File uploaded successfully',
+        'gallery_id': gallery_id,
+        'job_id': job_id,
+        'duplicate': duplicate
+    })
+
+_upload_locks = {}
+_upload_locks_guard = threading.Lock()
+
+def upload_chunk_lock(upload_id):
+    """Lock serializing writers to one upload session within this process"""
+    with _upload_locks_guard:
+        return _upload_locks.setdefault(upload_id, threading.Lock())
+
+def release_upload_lock(upload_id):
+    with _upload_locks_guard:
+        _upload_locks.pop(upload_id, None)
+
+@app.route('/api/gallery/jobs/<int:job_id>', methods=['GET'])
+def get_gallery_job(job_id):
+    """Report progress of a background upload-processing job"""
+    jobs = execute_query(
+        'SELECT id, kind, status, progress, attempts, max_attempts, error, result, created_at, updated_at '
+        'FROM jobs WHERE id = ?',
+        (job_id,), fetch=True
+    )
+    if not jobs:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    
+    job = dict(jobs[0])
+    job['result'] = json.loads(job['result']) if job['result'] else None
+    return jsonify({'success': True, 'job': job})
+
+# Media serving
+TIMESTAMPED_FILENAME = re.compile(r'^\d{8}_\d{6}_')
+
+def file_sha256(path):
+    """sha256 hex digest of a file, read in 1MB blocks"""
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+class ContentHashCache:
+    """sha256 digests of files, recomputed only when (mtime, size) changes"""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._digests = OrderedDict()  # path -> ((mtime_ns, size), digest)
+
+    def digest(self, path, stat=None):
+        stat = stat or os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._digests.get(path)
+            if cached and cached[0] == key:
+                self._digests.move_to_end(path)
+                return cached[1]
+        
+        digest = file_sha256(path)
+        
+        with self._lock:
+            self._digests[path] = (key, digest)
+            self._digests.move_to_end(path)
+            while len(self._digests) > self.max_entries:
+                self._digests.popitem(last=False)
+        return digest
+
+media_hashes = ContentHashCache()
+
+def send_media_file(path, immutable=False, etag=None):
+    """Send a media file with a strong content ETag, conditional GET and Range support.
+
+    send_file answers If-None-Match / If-Modified-Since with 304 and Range with
+    206, and hands the open file to wsgi.file_wrapper so servers such as
+    gunicorn can use sendfile(); USE_X_SENDFILE offloads to nginx/Apache.
+    Pass etag when the content hash is already known to skip hashing.
+    """
+    # Resolve relative paths the same way send_file does
+    path = os.path.join(app.root_path, path)
+    try:
+        stat = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        abort(404)
+    if not os.path.isfile(path):
         abort(404)
+    
+    max_age = app.config['MEDIA_IMMUTABLE_MAX_AGE'] if immutable else app.config['MEDIA_MAX_AGE']
+    response = send_file(
+        path,
+        conditional=True,
+        etag=etag or media_hashes.digest(path, stat),
+        last_modified=stat.st_mtime,
+        max_age=max_age
+    )
+    if immutable:
+        response.cache_control.immutable = True
+    return response
+
+# Responsive image derivatives
+DERIVATIVE_FORMATS = {'JPEG': 'jpg', 'PNG': 'png', 'WEBP': 'webp'}
+
+def get_derivatives_folder():
+    """Folder holding resized copies of gallery images"""
+    folder = os.path.join(app.config['GALLERY_FOLDER'], 'derivatives')
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+def generate_derivatives(source_path):
+    """Write resized and WebP copies of an image (EXIF is not carried over).
+
+    Returns (width, height, variants) where each variant is a dict with
+    width, height, format and filename (relative to the derivatives folder).
+    """
+    folder = get_derivatives_folder()
+    stem = Path(source_path).stem
+    variants = []
+    
+    with Image.open(source_path) as original:
+        width, height = original.size
+        if getattr(original, 'is_animated', False):
+            # Resizing would drop the animation; serve the original
+            return width, height, variants
+        image = ImageOps.exif_transpose(original)
+        native_format = original.format if original.format in DERIVATIVE_FORMATS else 'PNG'
+        
+        targets = [w for w in app.config['GALLERY_DERIVATIVE_WIDTHS'] if w < width] + [width]
+        for target_width in targets:
+            target_height = max(1, round(height * target_width / width))
+            resized = image if target_width == width else image.resize(
+                (target_width, target_height), Image.LANCZOS
+            )
+            formats = ['WEBP'] if target_width == width else [native_format, 'WEBP']
+            for fmt in dict.fromkeys(formats):
+                out = resized
+                if fmt == 'JPEG' and out.mode not in ('RGB', 'L'):
+                    out = out.convert('RGB')
+                name = f'{stem}_w{target_width}.{DERIVATIVE_FORMATS[fmt]}'
+                out.save(os.path.join(folder, name), fmt,
+                         quality=app.config['GALLERY_DERIVATIVE_QUALITY'], optimize=True)
+                variants.append({
+                    'width': target_width,
+                    'height': target_height,
+                    'format': fmt.lower(),
+                    'filename': name
+                })
+    return width, height, variants
+
+@job_handler('process_gallery_item')
+def process_gallery_item(payload, report_progress):
+    """Generate image derivatives for an upload, reusing those of identical content"""
+    source_path = payload['path']
+    content_hash = payload.get('content_hash')
+    result = {'sha256': content_hash or media_hashes.digest(source_path)}
+    report_progress(30)
+    
+    existing = execute_query('''
+        SELECT width, height, variants FROM gallery_items
+        WHERE content_hash = ? AND variants IS NOT NULL AND id != ?
+        LIMIT 1
+    ''', (content_hash, payload['gallery_id']), fetch=True) if content_hash else None
+    if existing:
+        execute_query(
+            'UPDATE gallery_items SET width = ?, height = ?, variants = ? WHERE id = ?',
+            (existing[0]['width'], existing[0]['height'], existing[0]['variants'], payload['gallery_id'])
+        )
+        result['variants'] = len(json.loads(existing[0]['variants']))
+        result['reused'] = True
+    elif payload['file_type'].startswith('image/') and Image is not None:
+        width, height, variants = generate_derivatives(source_path)
+        execute_query(
+            'UPDATE gallery_items SET width = ?, height = ?, variants = ? WHERE id = ?',
+            (width, height, json.dumps(variants), payload['gallery_id'])
+        )
+        result['variants'] = len(variants)
+        logger.info(f"Generated {len(variants)} derivatives for gallery item {payload['gallery_id']}")
+    response_cache.invalidate('gallery')
+    return result
+
+def pick_variant(variants, width, accept_webp):
+    """Smallest variant at least `width` wide, preferring WebP when accepted.
+
+    Returns None when no variant is wide enough, meaning the original fits best.
+    """
+    if not accept_webp:
+        variants = [v for v in variants if v['format'] != 'webp']
+    wide_enough = [v for v in variants if v['width'] >= width]
+    if not wide_enough:
+        return None
+    best = min(v['width'] for v in wide_enough)
+    candidates = [v for v in variants if v['width'] == best]
+    webp = [v for v in candidates if v['format'] == 'webp']
+    return (webp or candidates)[0]
 
-@app.route('/api/blog', methods=['GET'])
-def handle_blog():
-    """Handle blog post retrieval"""
-    # Get .sh files from the same directory as server.py
-    blog_folder = Path(app.config['BLOG_FOLDER'])
-    sh_files = list(blog_folder.glob('*.sh'))
+@app.route('/gallery/<filename>')
+def serve_gallery_file(filename):
+    """Serve gallery files, or the best-fitting derivative when ?w= is given"""
+    content_addressed = CONTENT_ADDRESSED_FILENAME.match(filename)
+    if content_addressed:
+        file_path = blob_path(content_addressed.group(1), content_addressed.group(2))
+    else:
+        # Legacy uploads stored flat under GALLERY_FOLDER
+        file_path = safe_join(app.config['GALLERY_FOLDER'], filename)
+        if file_path is None:
+            abort(404)
+    # Content-addressed and timestamped uploads never change
+    immutable = bool(content_addressed or TIMESTAMPED_FILENAME.match(filename))
     
-    blog_posts = []
-    for sh_file in sh_files:
-        try:
-            # Read file content for excerpt
-            with open(sh_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Get first few lines as excerpt
-                lines = content.split('\n')
-                excerpt = '\n'.join(lines[:5]) + ('...' if len(lines) > 5 else '')
+    width = request.args.get('w', type=int)
+    if width:
+        rows = execute_query(
+            'SELECT variants FROM gallery_items WHERE filename = ? AND variants IS NOT NULL LIMIT 1',
+            (filename,), fetch=True
+        )
+        variants = json.loads(rows[0]['variants']) if rows and rows[0]['variants'] else []
+        variant = pick_variant(variants, width, 'image/webp' in request.headers.get('Accept', ''))
+        if variant:
+            file_path = os.path.join(get_derivatives_folder(), variant['filename'])
+            content_addressed = None
+        response = send_media_file(file_path, immutable=immutable,
+                                   etag=content_addressed.group(1) if content_addressed else None)
+        response.vary.add('Accept')
+        return response
+    
+    return send_media_file(file_path, immutable=immutable,
+                           etag=content_addressed.group(1) if content_addressed else None)
+
+class BlogIndex:
+    """In-memory index of .sh blog posts, re-parsing only files whose (mtime, size) changed"""
+
+    EXCERPT_LINES = 5
+
+    def __init__(self, refresh_interval=2.0):
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._folder = None
+        self._entries = {}  # path -> ((mtime_ns, size), post)
+        self._posts = []
+        self._last_scan = 0.0
+        self._search_synced = False
+
+    def _parse(self, path, stat):
+        # Only the excerpt lines are read, never the whole file
+        with open(path, 'r', encoding='utf-8') as f:
+            head = ''.join(f.readline() for _ in range(self.EXCERPT_LINES))
+        if head.count('\n') == self.EXCERPT_LINES:
+            excerpt = head[:-1] + '...'
+        else:
+            excerpt = head
+        
+        return {
+            'title': Path(path).stem.replace('_', ' ').title(),
+            'filename': os.path.basename(path),
+            'author': 'Foundation Team',
+            'excerpt': excerpt,
+            'created_at': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            'size': stat.st_size
+        }
+
+    def refresh(self, force=False):
+        """Rescan the blog folder if the refresh interval has elapsed"""
+        folder = app.config['BLOG_FOLDER']
+        now = time.monotonic()
+        with self._lock:
+            if not force and folder == self._folder and now - self._last_scan < self.refresh_interval:
+                return
+            if folder != self._folder:
+                self._entries = {}
+                self._folder = folder
             
-            # Get file stats
-            stat = sh_file.stat()
+            entries = {}
+            changed = False
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if not entry.name.endswith('.sh') or not entry.is_file():
+                        continue
+                    try:
+                        stat = entry.stat()
+                        key = (stat.st_mtime_ns, stat.st_size)
+                        cached = self._entries.get(entry.path)
+                        if cached and cached[0] == key:
+                            entries[entry.path] = cached
+                            continue
+                        entries[entry.path] = (key, self._parse(entry.path, stat))
+                        changed = True
+                    except Exception as e:
+                        logger.error(f"Error reading {entry.path}: {e}")
             
-            blog_posts.append({
-                'title': sh_file.stem.replace('_', ' ').title(),
-                'filename': sh_file.name,
-                'author': 'Foundation Team',
-                'excerpt': excerpt,
-                'created_at': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                'size': stat.st_size
-            })
-        except Exception as e:
-            logger.error(f"Error reading {sh_file}: {e}")
-            continue
-    
-    # Sort by creation time (newest first)
-    blog_posts.sort(key=lambda x: x['created_at'], reverse=True)
+            if changed or entries.keys() != self._entries.keys() or not self._search_synced:
+                # Sort by creation time (newest first)
+                self._posts = sorted((post for _, post in entries.values()),
+                                     key=lambda x: x['created_at'], reverse=True)
+                self._search_synced = sync_blog_search_index(entries)
+            self._entries = entries
+            self._last_scan = now
+
+    def posts(self):
+        """Sorted post summaries, served from memory"""
+        self.refresh()
+        return self._posts
+
+def sync_blog_search_index(entries):
+    """Bring blog_posts_fts in line with scanned blog files; returns True on success.
+
+    entries maps path -> ((mtime_ns, size), post). Only files whose key
+    differs from the indexed one are read in full.
+    """
+    wanted = {post['filename']: (path, key, post) for path, (key, post) in entries.items()}
+    try:
+        with get_db_connection() as conn:
+            indexed = {row['filename']: (row['rowid'], (row['mtime_ns'], row['size'])) for row in conn.execute(
+                'SELECT rowid, filename, mtime_ns, size FROM blog_posts_fts')}
+            stale = [rowid for filename, (rowid, key) in indexed.items()
+                     if filename not in wanted or wanted[filename][1] != key]
+            fresh = [(filename, path, key, post) for filename, (path, key, post) in wanted.items()
+                     if filename not in indexed or indexed[filename][1] != key]
+            if not stale and not fresh:
+                return True
+            
+            rows = []
+            for filename, path, key, post in fresh:
+                try:
+                    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                        body = f.read()
+                except OSError as e:
+                    logger.error(f"Error indexing {path}: {e}")
+                    continue
+                rows.append((filename, key[0], key[1], post['title'], body))
+            conn.executemany('DELETE FROM blog_posts_fts WHERE rowid = ?', [(rowid,) for rowid in stale])
+            conn.executemany('INSERT INTO blog_posts_fts (filename, mtime_ns, size, title, body) '
+                             'VALUES (?, ?, ?, ?, ?)', rows)
+            conn.commit()
+        logger.info(f"Blog search index updated: {len(rows)} indexed, {len(stale)} removed")
+        return True
+    except sqlite3.Error as e:
+        logger.error(f"Blog search index sync failed: {e}")
+        return False
+
+blog_index = BlogIndex(refresh_interval=app.config['BLOG_INDEX_REFRESH_INTERVAL'])
+
+@app.route('/api/blog', methods=['GET'])
+@cached_response('blog', ttl=Config.BLOG_INDEX_REFRESH_INTERVAL)
+def handle_blog():
+    """Handle blog post retrieval"""
+    blog_posts = blog_index.posts()
     
-    return jsonify({
+    return json_response({
         'success': True,
         'posts': blog_posts,
         'total_count': len(blog_posts)
@@ -2632,20 +5991,77 @@ def download_blog_post(filename):
     
     return send_file(file_path, as_attachment=True)
 
+def fts_query(text):
+    """Turn free text into a safe FTS5 query: all words must match, the last as a prefix"""
+    words = re.findall(r'\w+', text)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words[:-1]]
+    terms.append(f'("{words[-1]}" OR "{words[-1]}"*)')
+    return ' '.join(terms)
+
+def highlight(snippet):
+    return html.escape(snippet or '').replace('\x02', '<mark>').replace('\x03', '</mark>')
+
+@app.route('/api/search', methods=['GET'])
+def handle_search():
+    """Ranked full-text search over messages, members, events and blog posts"""
+    query = fts_query(request.args.get('q', ''))
+    if query is None:
+        return jsonify({'success': False, 'error': 'q is required'}), 400
+    
+    signed_in = 'user' in session
+    default_kinds = [k for k in SEARCH_SQL if signed_in or k not in SEARCH_PRIVATE_TYPES]
+    kinds = [k.strip() for k in request.args.get('types', ','.join(default_kinds)).split(',') if k.strip()]
+    unknown = [k for k in kinds if k not in SEARCH_SQL]
+    if unknown:
+        return jsonify({'success': False, 'error': f"Unknown types: {', '.join(unknown)}"}), 400
+    if not signed_in and any(k in SEARCH_PRIVATE_TYPES for k in kinds):
+        return jsonify({'success': False, 'error': 'Login required'}), 401
+    try:
+        limit = int(request.args.get('limit', app.config['SEARCH_DEFAULT_LIMIT']))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'limit must be an integer'}), 400
+    limit = max(1, min(limit, app.config['SEARCH_MAX_LIMIT']))
+    
+    if 'blog' in kinds:
+        blog_index.refresh()
+    
+    started = time.perf_counter()
+    results = {}
+    try:
+        with get_db_connection() as conn:
+            for kind in kinds:
+                hits = []
+                for row in conn.execute(SEARCH_SQL[kind], (query, limit)):
+                    hit = dict(row)
+                    hit['snippet'] = highlight(hit['snippet'])
+                    hits.append(hit)
+                results[kind] = hits
+    except sqlite3.Error as e:
+        logger.error(f"Search failed for {query!r}: {e}")
+        return jsonify({'success': False, 'error': 'Search failed'}), 500
+    
+    return json_response({
+        'success': True,
+        'query': request.args.get('q'),
+        'results': results,
+        'took_ms': round((time.perf_counter() - started) * 1000, 2)
+    })
+
 @app.route('/api/stats')
+@versioned_etag('members', 'events', 'contact_messages', 'gallery_items')
+@cached_response('stats')
 def get_stats():
     """Get organization statistics"""
-    member_count = execute_query('SELECT COUNT(*) as count FROM members WHERE active = 1', fetch=True)
-    member_count = member_count[0]['count'] if member_count else 54
+    # Single primary-key read; the counters are kept current by triggers
+    counters = execute_query(STATS_SQL, fetch=True)
+    counters = counters[0] if counters else None
     
-    event_count = execute_query('SELECT COUNT(*) as count FROM events', fetch=True)
-    event_count = event_count[0]['count'] if event_count else 127
-    
-    message_count = execute_query('SELECT COUNT(*) as count FROM contact_messages', fetch=True)
-    message_count = message_count[0]['count'] if message_count else 0
-    
-    gallery_count = execute_query('SELECT COUNT(*) as count FROM gallery_items', fetch=True)
-    gallery_count = gallery_count[0]['count'] if gallery_count else 0
+    member_count = counters['members'] if counters else 54
+    event_count = counters['events'] if counters else 127
+    message_count = counters['messages'] if counters else 0
+    gallery_count = counters['gallery_items'] if counters else 0
     
     return jsonify({
         'success': True,
@@ -2669,6 +6085,22 @@ def health_check():
         'features': ['foundation_website', 'donation_system', 'volunteer_management', 'mobile_responsive']
     })
 
+@app.route('/api/metrics')
+def get_metrics():
+    """Internal performance counters"""
+    job_counts = execute_query('SELECT status, COUNT(*) AS count FROM jobs GROUP BY status', fetch=True)
+    return jsonify({
+        'success': True,
+        'metrics': {
+            'db_pool': get_db_pool().stats(),
+            'jobs': {row['status']: row['count'] for row in job_counts or []},
+            'compression': response_compressor.stats(),
+            'write_behind': write_behind.stats(),
+            'response_cache': response_cache.stats(),
+            'event_stream': event_bus.stats()
+        }
+    })
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
@@ -2826,6 +6258,50 @@ if __name__ == '__main__':
     if '--sample-data' in sys.argv:
         create_sample_data()
     
+    # Recompute stats counters from scratch, then exit
+    if '--reconcile-stats' in sys.argv:
+        before, after = reconcile_stats_counters()
+        logger.info(f"Stats counters reconciled: {before} -> {after}")
+        sys.exit(0)
+    
+    # Remove unreferenced gallery blobs, then exit
+    if '--gc-blobs' in sys.argv:
+        removed = collect_orphaned_blobs()
+        logger.info(f"Removed {removed} orphaned gallery blobs")
+        sys.exit(0)
+    
+    # Verify every hot route query is index-backed, then exit
+    if '--check-query-plans' in sys.argv:
+        with get_db_connection() as conn:
+            problems = check_query_plans(conn)
+        for route, detail in problems:
+            logger.error(f"Full scan in {route}: {detail}")
+        if not problems:
+            logger.info(f"All {len(HOT_QUERIES)} hot queries use indexes")
+        sys.exit(1 if problems else 0)
+    
+    # Compare JSON serializers on 10k-row member and event lists, then exit
+    if '--benchmark-serializer' in sys.argv:
+        for resource, timings in benchmark_serializers().items():
+            summary = ', '.join(f'{name} {us} us/row' for name, us in timings.items())
+            logger.info(f"Serializing {resource}: {summary}")
+        sys.exit(0)
+    
+    # Concurrent signups against a scratch database; fails if an event is overbooked
+    if '--load-test-registrations' in sys.argv:
+        report = load_test_registrations()
+        logger.info(f"Registration load test: {report}")
+        sys.exit(0 if report['ok'] else 1)
+    
+    # Expand recurring events up to the rolling horizon, then exit (e.g. from a daily cron)
+    if '--materialize-occurrences' in sys.argv:
+        added = materialize_occurrences()
+        logger.info(f"Materialized {added} event occurrences")
+        sys.exit(0)
+    
+    # Resume any queued or interrupted background jobs now rather than on the first request
+    job_queue.ensure_started()
+    
     # Get port from environment or default to 5000
     port = int(os.environ.get('PORT', 5000))
     
@@ -2837,17 +6313,32 @@ if __name__ == '__main__':
     logger.info("  GET  /                    - Foundation website")
     logger.info("  POST /api/login           - Admin login")
     logger.info("  POST /api/logout          - Logout")
+    logger.info("  GET  /api/stream          - Dashboard updates (Server-Sent Events)")
     logger.info("  GET  /api/members         - Get volunteers")
     logger.info("  POST /api/members         - Add volunteer")
     logger.info("  GET  /api/events          - Get events")
+    logger.info("  GET  /api/events?from=&to= - Event occurrences in a date range")
     logger.info("  POST /api/events          - Create event")
+    logger.info("  GET  /api/members/match?skills=&event_id= - Rank volunteers by skills")
+    logger.info("  GET  /api/members/birthdays?window=7 - Upcoming birthdays")
+    logger.info("  POST /api/members/bulk    - Import volunteers (NDJSON/CSV)")
+    logger.info("  POST /api/events/bulk     - Import events (NDJSON/CSV)")
+    logger.info("  POST /api/events/<id>/register - Register (DELETE with cancel_token to cancel)")
     logger.info("  GET  /api/contact         - Get messages")
     logger.info("  POST /api/contact         - Submit contact form")
+    logger.info("  POST /api/newsletter      - Newsletter signup")
     logger.info("  GET  /api/gallery         - Get gallery")
     logger.info("  POST /api/gallery/upload  - Upload media")
+    logger.info("  POST /api/gallery/uploads - Start resumable upload")
+    logger.info("  PUT  /api/gallery/uploads/<id>?offset=N - Upload chunk")
+    logger.info("  POST /api/gallery/uploads/<id>/complete - Finish resumable upload")
+    logger.info("  GET  /api/gallery/jobs/<id> - Upload processing status")
+    logger.info("  GET  /api/export/<table>?format=ndjson|csv - Stream a table export")
     logger.info("  GET  /api/blog            - Get blog posts")
+    logger.info("  GET  /api/search?q=       - Full-text search")
     logger.info("  GET  /api/stats           - Get statistics")
     logger.info("  GET  /health              - Health check")
+    logger.info("  GET  /api/metrics         - Performance counters")
     logger.info("⚓" * 50)
     logger.info("🆕 Foundation Features:")
     logger.info("   💝 Professional Foundation Design - Clean, modern, trustworthy")
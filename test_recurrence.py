@@ -0,0 +1,24 @@
+from datetime import date
+
+from server import expand_rrule, parse_rrule
+
+
+def expand(rule, start, end='2026-12-31'):
+    return [day.isoformat() for day in
+            expand_rrule(parse_rrule(rule), date.fromisoformat(start), date.fromisoformat(end))]
+
+
+def test_monthly_byday_and_bymonthday_must_both_match():
+    assert expand('FREQ=MONTHLY;BYDAY=FR;BYMONTHDAY=13;COUNT=3', '2026-01-01') == [
+        '2026-02-13', '2026-03-13', '2026-11-13']
+
+
+def test_monthly_byday_with_negative_bymonthday():
+    # Last day of the month, only when it falls on a Saturday or Sunday
+    assert expand('FREQ=MONTHLY;BYDAY=SA,SU;BYMONTHDAY=-1', '2026-01-01') == [
+        '2026-01-31', '2026-02-28', '2026-05-31', '2026-10-31']
+
+
+def test_monthly_byday_alone_still_selects_every_match():
+    assert expand('FREQ=MONTHLY;BYDAY=1MO,-1FR;COUNT=4', '2026-01-01') == [
+        '2026-01-05', '2026-01-30', '2026-02-02', '2026-02-27']